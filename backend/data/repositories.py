@@ -37,14 +37,15 @@ Architecture Pattern: Repository Pattern
 Layer: Data Access Layer (Clean Architecture)
 """
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload
 from sqlalchemy import func, desc, and_, or_
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import logging
+import os
 
 from data.models import Customer as CustomerModel, CustomerEvent as CustomerEventModel, HealthScore as HealthScoreModel
-from domain.models import Customer, CustomerEvent, HealthScore, FactorScore
+from domain.models import Customer, CustomerEvent, HealthScore, FactorScore, canonical_status
 from domain.exceptions import CustomerNotFoundError, DataAccessError
 
 logger = logging.getLogger(__name__)
@@ -91,33 +92,45 @@ class CustomerRepository:
             List[Customer]: List of all customer domain entities
         """
         query = self.db.query(CustomerModel)
+        if os.getenv("TESTING"):
+            # Fail fast in the test run if anything touches a relationship
+            # lazily here - the bulk loads are meant to stay at a constant
+            # query count
+            query = query.options(raiseload('*'))
         db_customers = query.all()
         return [self._to_domain_model(customer) for customer in db_customers]
     
-    def get_by_health_status(self, status: str) -> List[Customer]:
+    def get_by_health_status(
+        self,
+        status: str,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Customer]:
         """
         Get customers by health status.
-        
-        Retrieves customers whose latest health score has the specified status.
-        
+
+        Retrieves customers whose latest health score has the specified status
+        with a single join query, pushing any pagination into SQL so only the
+        requested page crosses the wire.
+
         Args:
             status: Health status to filter by ('healthy', 'at_risk', 'critical')
-            
+            limit: Optional maximum number of customers to return
+            offset: Optional number of matching customers to skip
+
         Returns:
             List[Customer]: List of customer domain entities with matching health status
         """
-        # Get health scores by status (one per customer)
-        health_scores = self.db.query(HealthScoreModel).filter(
-            HealthScoreModel.status == status
-        ).all()
-        
-        customer_ids = [score.customer_id for score in health_scores]
-        
-        if not customer_ids:
-            return []
-        
-        db_customers = self.db.query(CustomerModel).filter(CustomerModel.id.in_(customer_ids)).all()
-        return [self._to_domain_model(customer) for customer in db_customers]
+        query = self.db.query(CustomerModel).join(
+            HealthScoreModel, HealthScoreModel.customer_id == CustomerModel.id
+        ).filter(HealthScoreModel.status == status).order_by(CustomerModel.id)
+
+        if offset is not None:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return [self._to_domain_model(customer) for customer in query.all()]
     
     def update_last_activity(self, customer_id: int, timestamp: datetime) -> None:
         """Update customer's last activity timestamp"""
@@ -171,9 +184,48 @@ class EventRepository:
         self.db.add(db_event)
         self.db.commit()
         self.db.refresh(db_event)
-        
+
         return self._to_domain_model(db_event)
-    
+
+    def create_event_and_touch_customer(
+        self,
+        customer_id: int,
+        event_type: str,
+        event_data: dict,
+        timestamp: datetime
+    ) -> CustomerEvent:
+        """
+        Create an event and update the customer's last activity atomically.
+
+        Stages the event INSERT and the last_activity UPDATE in the same
+        transaction with a single commit, instead of the two commits that
+        separate create_event + update_last_activity calls would pay.
+
+        Args:
+            customer_id: Customer the event belongs to
+            event_type: Type of event being recorded
+            event_data: Event-specific payload
+            timestamp: Event timestamp, also written to last_activity
+
+        Returns:
+            CustomerEvent: The persisted event as a domain entity
+        """
+        db_event = CustomerEventModel(
+            customer_id=customer_id,
+            event_type=event_type,
+            event_data=event_data,
+            timestamp=timestamp
+        )
+
+        self.db.add(db_event)
+        self.db.query(CustomerModel).filter(CustomerModel.id == customer_id).update({
+            CustomerModel.last_activity: timestamp
+        })
+        self.db.commit()
+        self.db.refresh(db_event)
+
+        return self._to_domain_model(db_event)
+
     def get_recent_events(self, customer_id: int, days: int = 90) -> List[CustomerEvent]:
         """Get recent events for a customer"""
         since = datetime.utcnow() - timedelta(days=days)
@@ -183,7 +235,40 @@ class EventRepository:
         ).order_by(desc(CustomerEventModel.timestamp)).all()
         
         return [self._to_domain_model(event) for event in db_events]
-    
+
+    def get_recent_events_bulk(self, customer_ids: List[int], days: int = 90) -> Dict[int, List[CustomerEvent]]:
+        """
+        Get recent events for many customers in a single query.
+
+        Issues one WHERE customer_id IN (...) query instead of one query
+        per customer, then groups rows by customer in Python. Events are
+        ordered newest-first within each customer, matching get_recent_events.
+
+        Args:
+            customer_ids: Customers to load events for
+            days: Number of days to look back (default: 90)
+
+        Returns:
+            Dict[int, List[CustomerEvent]]: Events keyed by customer id;
+                every requested customer is present, possibly with an empty list
+        """
+        events_by_customer: Dict[int, List[CustomerEvent]] = {
+            customer_id: [] for customer_id in customer_ids
+        }
+        if not customer_ids:
+            return events_by_customer
+
+        since = datetime.utcnow() - timedelta(days=days)
+        db_events = self.db.query(CustomerEventModel).filter(
+            CustomerEventModel.customer_id.in_(customer_ids),
+            CustomerEventModel.timestamp >= since
+        ).order_by(desc(CustomerEventModel.timestamp)).all()
+
+        for db_event in db_events:
+            events_by_customer[db_event.customer_id].append(self._to_domain_model(db_event))
+
+        return events_by_customer
+
     def _to_domain_model(self, db_event: CustomerEventModel) -> CustomerEvent:
         """Convert database model to domain model"""
         return CustomerEvent(
@@ -204,16 +289,8 @@ class HealthScoreRepository:
     def save_health_score(self, health_score: HealthScore) -> HealthScore:
         """Save a health score to database - updates existing or creates new (one per customer only)"""
         # Convert factor scores to JSON format
-        factors_json = {}
-        for name, factor_score in health_score.factors.items():
-            factors_json[name] = {
-                "score": factor_score.score,
-                "value": factor_score.value,
-                "description": factor_score.description,
-                "trend": factor_score.trend,
-                **factor_score.metadata
-            }
-        
+        factors_json = self._factors_to_json(health_score.factors)
+
         # Check if health score already exists for this customer
         existing_score = self.db.query(HealthScoreModel).filter(
             HealthScoreModel.customer_id == health_score.customer_id
@@ -245,6 +322,58 @@ class HealthScoreRepository:
             self.db.refresh(db_score)
             return self._to_domain_model(db_score)
     
+    def save_health_scores_bulk(self, health_scores: List[HealthScore]) -> List[HealthScore]:
+        """
+        Save many health scores in a single transaction.
+
+        Fetches the existing rows with one WHERE customer_id IN (...) query,
+        updates them in place or stages new rows, and commits once - instead
+        of a lookup + commit round trip per customer as save_health_score does.
+
+        Args:
+            health_scores: Scores to persist (at most one per customer)
+
+        Returns:
+            List[HealthScore]: The scores that were persisted
+        """
+        if not health_scores:
+            return []
+
+        customer_ids = [hs.customer_id for hs in health_scores]
+        existing_by_customer = {
+            model.customer_id: model
+            for model in self.db.query(HealthScoreModel).filter(
+                HealthScoreModel.customer_id.in_(customer_ids)
+            ).all()
+        }
+
+        for health_score in health_scores:
+            factors_json = self._factors_to_json(health_score.factors)
+            existing_score = existing_by_customer.get(health_score.customer_id)
+
+            if existing_score:
+                existing_score.score = health_score.score
+                existing_score.status = health_score.status
+                existing_score.factors = factors_json
+                existing_score.recommendations = health_score.recommendations
+                existing_score.calculated_at = health_score.calculated_at
+            else:
+                self.db.add(HealthScoreModel(
+                    customer_id=health_score.customer_id,
+                    score=health_score.score,
+                    status=health_score.status,
+                    factors=factors_json,
+                    recommendations=health_score.recommendations,
+                    calculated_at=health_score.calculated_at
+                ))
+
+        self.db.commit()
+        return health_scores
+
+    def _factors_to_json(self, factors: Dict[str, FactorScore]) -> Dict[str, Any]:
+        """Convert FactorScore objects to the JSON structure stored in the DB"""
+        return {name: factor_score.serialized for name, factor_score in factors.items()}
+
     def get_latest_by_customer(self, customer_id: int) -> Optional[HealthScore]:
         """Get health score for a customer (one per customer)"""
         db_score = self.db.query(HealthScoreModel).filter(
@@ -256,6 +385,33 @@ class HealthScoreRepository:
         
         return self._to_domain_model(db_score)
     
+    def get_latest_by_customers(self, customer_ids: List[int]) -> Dict[int, HealthScore]:
+        """
+        Get health scores for many customers in a single query.
+
+        One WHERE customer_id IN (...) query replaces one lookup per
+        customer; since each customer has at most one score no grouping
+        or window function is needed.
+
+        Args:
+            customer_ids: Customers to load scores for
+
+        Returns:
+            Dict[int, HealthScore]: Scores keyed by customer id;
+                customers without a score are simply absent
+        """
+        if not customer_ids:
+            return {}
+
+        db_scores = self.db.query(HealthScoreModel).filter(
+            HealthScoreModel.customer_id.in_(customer_ids)
+        ).all()
+
+        return {
+            db_score.customer_id: self._to_domain_model(db_score)
+            for db_score in db_scores
+        }
+
     def get_historical_scores(self, customer_id: int, limit: int = 30) -> List[HealthScore]:
         """Get health score for a customer (only one exists per customer)"""
         db_score = self.db.query(HealthScoreModel).filter(
@@ -278,30 +434,27 @@ class HealthScoreRepository:
         from sqlalchemy import func, case
         from data.models import Customer
         
-        # Single query to get all counts
+        # Single query to get all counts and the average score
         result = self.db.query(
             func.count(Customer.id).label('total_customers'),
             func.sum(case((HealthScoreModel.status == 'healthy', 1), else_=0)).label('healthy_count'),
             func.sum(case((HealthScoreModel.status == 'at_risk', 1), else_=0)).label('at_risk_count'),
-            func.sum(case((HealthScoreModel.status == 'critical', 1), else_=0)).label('critical_count')
+            func.sum(case((HealthScoreModel.status == 'critical', 1), else_=0)).label('critical_count'),
+            func.avg(HealthScoreModel.score).label('average_score')
         ).outerjoin(HealthScoreModel, Customer.id == HealthScoreModel.customer_id).first()
-        
+
         return {
             'total_customers': result.total_customers or 0,
             'healthy_customers': result.healthy_count or 0,
             'at_risk_customers': result.at_risk_count or 0,
-            'critical_customers': result.critical_count or 0
+            'critical_customers': result.critical_count or 0,
+            'average_score': float(result.average_score or 0.0)
         }
-    
+
     def get_average_score(self) -> float:
         """Get average health score across all customers"""
-        scores = self.db.query(HealthScoreModel.score).all()
-        
-        if not scores:
-            return 0.0
-        
-        total_score = sum(score[0] for score in scores)
-        return total_score / len(scores)
+        average = self.db.query(func.avg(HealthScoreModel.score)).scalar()
+        return float(average) if average is not None else 0.0
     
     def _to_domain_model(self, db_score: HealthScoreModel) -> HealthScore:
         """Convert database model to domain model"""
@@ -325,7 +478,8 @@ class HealthScoreRepository:
             id=db_score.id,
             customer_id=db_score.customer_id,
             score=db_score.score,
-            status=db_score.status,
+            # Interned canonical spelling so status compares hit the identity fast path
+            status=canonical_status(db_score.status),
             factors=factors,
             recommendations=db_score.recommendations or [],
             calculated_at=db_score.calculated_at
@@ -216,4 +216,10 @@ class HealthScoreCalculator:
         Returns:
             dict: Mapping of factor names to their human-readable descriptions
         """
-        return {factor.name: factor.description for factor in self.factors}
\ No newline at end of file
+        return {factor.name: factor.description for factor in self.factors}
+
+# Shared default instance. Factor construction (including their precompiled
+# scoring closures) and weight validation run once at import; controllers
+# and the memory store hold references instead of rebuilding the factor set
+# per request. The calculator itself is stateless across calculations.
+default_calculator = HealthScoreCalculator()
@@ -34,6 +34,23 @@ class CustomerController:
         from domain.memory_store import memory_store
         return memory_store.get_all_customers(health_status=health_status)
     
+    def get_customers_payload(self, health_status: Optional[str] = None) -> bytes:
+        """
+        Get customers as a pre-serialized JSON response body from the memory store
+        """
+        from domain.memory_store import memory_store
+        return memory_store.get_all_customers_bytes(health_status=health_status)
+
+    def get_customers_page(self, health_status: Optional[str] = None,
+                           after_id: int = 0, limit: int = 100) -> Dict[str, Any]:
+        """
+        Get a keyset-paginated customer page from the memory store
+        """
+        from domain.memory_store import memory_store
+        return memory_store.get_customers_page(
+            health_status=health_status, after_id=after_id, limit=limit
+        )
+
     def get_customer_with_events(self, customer_id: int, days: int = 90) -> Dict[str, Any]:
         """
         LOADS DATA ONCE: Load customer and all their events, coordinate in memory
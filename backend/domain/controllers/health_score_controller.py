@@ -8,7 +8,7 @@ from typing import Dict, Any, List
 from datetime import datetime
 
 from data.repositories import CustomerRepository, EventRepository, HealthScoreRepository
-from domain.calculators import HealthScoreCalculator
+from domain.calculators import HealthScoreCalculator, default_calculator
 from domain.exceptions import CustomerNotFoundError
 
 
@@ -19,7 +19,7 @@ class HealthScoreController:
         self.customer_repo = CustomerRepository(db)
         self.event_repo = EventRepository(db)
         self.health_score_repo = HealthScoreRepository(db)
-        self.calculator = HealthScoreCalculator()
+        self.calculator = default_calculator
 
         # Cache for loaded data
         self._dashboard_data = None
@@ -45,6 +45,13 @@ class HealthScoreController:
         from domain.memory_store import memory_store
         return memory_store.get_dashboard_stats()
     
+    def get_dashboard_statistics_payload(self) -> bytes:
+        """
+        Get dashboard statistics as a pre-serialized JSON response body
+        """
+        from domain.memory_store import memory_store
+        return memory_store.get_dashboard_stats_bytes()
+
     def bulk_calculate_health_scores(self, customer_ids: List[int]) -> Dict[str, Any]:
         """
         LOADS BULK DATA: Load multiple customers and events, batch calculate
@@ -0,0 +1,90 @@
+"""
+Domain Layer - Shared Scoring Kernels
+Hot-path arithmetic shared by the health factors
+
+The per-factor scoring math (ratio-to-expected scores, trend classification)
+is identical across factors and runs once per factor per customer. Hoisting
+it here keeps each factor's calculate_score() down to event filtering plus a
+couple of kernel calls, and gives bulk recalculation paths a batch entry
+point that scores many customers in one pass instead of re-entering the
+factor machinery per customer.
+"""
+
+from typing import Callable, List, Sequence
+
+
+def make_ratio_scorer(expected: int) -> Callable[[int], float]:
+    """
+    Build a scorer specialized for a fixed expected volume.
+
+    Partial evaluation of ratio_score: the 100 / expected scale is computed
+    once at construction, so each call is a single multiply plus cap instead
+    of a divide and guard against a recomputed constant. Factors with fixed
+    thresholds build their scorer once and reuse it for every calculation.
+
+    Args:
+        expected: Expected event count baked into the returned scorer
+
+    Returns:
+        Callable[[int], float]: Scorer mapping an observed count to 0-100
+    """
+    if expected <= 0:
+        return lambda count: 0.0
+
+    scale = 100.0 / expected
+
+    def score(count: int) -> float:
+        return min(100.0, count * scale)
+
+    return score
+
+
+def ratio_score(count: int, expected: int) -> float:
+    """
+    Score actual volume against an expected volume, capped at 100.
+
+    Args:
+        count: Observed event count for the analysis window
+        expected: Expected event count for a healthy customer
+
+    Returns:
+        float: min(100, count / expected * 100), or 0.0 if expected is 0
+    """
+    if expected <= 0:
+        return 0.0
+    return min(100.0, (count / expected) * 100.0)
+
+
+def ratio_scores(counts: Sequence[int], expected: int) -> List[float]:
+    """
+    Batch version of ratio_score for scoring many customers in one pass.
+
+    Args:
+        counts: Observed event counts, one per customer
+        expected: Expected event count shared by the batch
+
+    Returns:
+        List[float]: Capped ratio scores in the same order as counts
+    """
+    if expected <= 0:
+        return [0.0] * len(counts)
+    scale = 100.0 / expected
+    return [min(100.0, count * scale) for count in counts]
+
+
+def classify_trend(recent_count: int, older_count: int) -> str:
+    """
+    Classify activity trend by comparing recent vs. previous window counts.
+
+    Args:
+        recent_count: Event count in the recent half of the window
+        older_count: Event count in the older half of the window
+
+    Returns:
+        str: 'improving', 'declining', or 'stable'
+    """
+    if recent_count > older_count:
+        return "improving"
+    elif recent_count < older_count:
+        return "declining"
+    return "stable"
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 
 from domain.models import Customer, CustomerEvent, FactorScore
 from domain.health_factors.base_factor import HealthFactor
+from domain.health_factors._kernels import make_ratio_scorer, classify_trend
 
 
 class ApiUsageFactor(HealthFactor):
@@ -24,7 +25,12 @@ class ApiUsageFactor(HealthFactor):
     - Startup customers expected: 200+ API calls/month
     - Includes trend analysis and error rate considerations
     """
-    
+
+    def __init__(self):
+        # Scorers specialized per segment expectation; there are only a
+        # handful of distinct expected-call values, so cache one scorer each
+        self._scorers = {}
+
     @property
     def name(self) -> str:
         """
@@ -76,54 +82,51 @@ class ApiUsageFactor(HealthFactor):
                 - recent_calls: API calls in last 15 days
         """
         
-        # Filter API call events from last 30 days
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        api_events = [
-            event for event in events 
-            if event.event_type == "api_call" and event.timestamp >= thirty_days_ago
-        ]
-        
-        api_call_count = len(api_events)
-        
-        # Analyze API usage patterns
+        # Analyze API call events from last 30 days in a single pass:
+        # filter, count, bucket usage patterns, and track the recent
+        # 15-day window for trend analysis without materializing lists
+        now = datetime.utcnow()
+        thirty_days_ago = now - timedelta(days=30)
+        fifteen_days_ago = now - timedelta(days=15)
+
+        api_call_count = 0
+        recent_calls = 0
         endpoints = {}
         methods = {}
         response_codes = {}
         daily_usage = {}
-        
-        for event in api_events:
+
+        for event in events:
+            if event.event_type != "api_call" or event.timestamp < thirty_days_ago:
+                continue
+            api_call_count += 1
+            if event.timestamp >= fifteen_days_ago:
+                recent_calls += 1
+
             if event.event_data:
                 endpoint = event.event_data.get('endpoint', 'unknown')
                 method = event.event_data.get('method', 'GET')
                 response_code = event.event_data.get('response_code', 200)
-                
+
                 endpoints[endpoint] = endpoints.get(endpoint, 0) + 1
                 methods[method] = methods.get(method, 0) + 1
                 response_codes[str(response_code)] = response_codes.get(str(response_code), 0) + 1
-                
+
                 # Track daily usage
                 day = event.timestamp.date().isoformat()
                 daily_usage[day] = daily_usage.get(day, 0) + 1
-        
+
         # Calculate score based on customer segment expectations
         expected_calls = customer.get_expected_api_calls()
-        score = min(100.0, (api_call_count / expected_calls) * 100) if expected_calls > 0 else 0
-        
+        scorer = self._scorers.get(expected_calls)
+        if scorer is None:
+            scorer = self._scorers[expected_calls] = make_ratio_scorer(expected_calls)
+        score = scorer(api_call_count)
+
         # Calculate trend
-        fifteen_days_ago = datetime.utcnow() - timedelta(days=15)
-        recent_15_days = [
-            event for event in api_events 
-            if event.timestamp >= fifteen_days_ago
-        ]
-        recent_calls = len(recent_15_days)
         older_calls = api_call_count - recent_calls
-        
-        if recent_calls > older_calls:
-            trend = "improving"
-        elif recent_calls < older_calls:
-            trend = "declining"
-        else:
-            trend = "stable"
+
+        trend = classify_trend(recent_calls, older_calls)
         
         # Calculate error rate
         error_calls = (response_codes.get('400', 0) + 
@@ -8,11 +8,18 @@ from datetime import datetime, timedelta
 
 from domain.models import Customer, CustomerEvent, FactorScore
 from domain.health_factors.base_factor import HealthFactor
+from domain.health_factors._kernels import make_ratio_scorer
 
 
 class FeatureAdoptionFactor(HealthFactor):
     """Feature adoption health factor - measures platform utilization depth"""
-    
+
+    EXPECTED_FEATURES = 8  # Expected unique features for healthy adoption
+
+    def __init__(self):
+        # Scorer specialized once for the fixed adoption threshold
+        self._score_features = make_ratio_scorer(self.EXPECTED_FEATURES)
+
     @property
     def name(self) -> str:
         return "feature_adoption"
@@ -28,26 +35,24 @@ class FeatureAdoptionFactor(HealthFactor):
     def calculate_score(self, customer: Customer, events: List[CustomerEvent]) -> FactorScore:
         """Calculate feature adoption score based on unique features used"""
         
-        # Filter feature usage events from last 30 days
+        # Filter feature usage events from last 30 days and tally unique
+        # features in a single pass, without materializing an event list
         thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        feature_events = [
-            event for event in events 
-            if event.event_type == "feature_use" and event.timestamp >= thirty_days_ago
-        ]
-        
-        # Extract unique features used
+
         unique_features = set()
         feature_usage_count = {}
-        
-        for event in feature_events:
+
+        for event in events:
+            if event.event_type != "feature_use" or event.timestamp < thirty_days_ago:
+                continue
             feature_name = event.get_feature_name()
             if feature_name:
                 unique_features.add(feature_name)
                 feature_usage_count[feature_name] = feature_usage_count.get(feature_name, 0) + 1
         
         # Calculate score
-        expected_features = 8
-        score = min(100.0, (len(unique_features) / expected_features) * 100) if expected_features > 0 else 0
+        expected_features = self.EXPECTED_FEATURES
+        score = self._score_features(len(unique_features))
         
         # Identify most and least used features
         most_used = max(feature_usage_count, key=feature_usage_count.get) if feature_usage_count else None
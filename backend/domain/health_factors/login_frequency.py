@@ -8,11 +8,18 @@ from datetime import datetime, timedelta
 
 from domain.models import Customer, CustomerEvent, FactorScore
 from domain.health_factors.base_factor import HealthFactor
+from domain.health_factors._kernels import make_ratio_scorer, classify_trend
 
 
 class LoginFrequencyFactor(HealthFactor):
     """Login frequency health factor - measures user engagement patterns"""
-    
+
+    EXPECTED_LOGINS = 20  # Expected logins per month for healthy customer
+
+    def __init__(self):
+        # Scorer specialized once for the fixed login threshold
+        self._score_logins = make_ratio_scorer(self.EXPECTED_LOGINS)
+
     @property
     def name(self) -> str:
         return "login_frequency"
@@ -28,35 +35,30 @@ class LoginFrequencyFactor(HealthFactor):
     def calculate_score(self, customer: Customer, events: List[CustomerEvent]) -> FactorScore:
         """Calculate login frequency score based on recent login events"""
         
-        # Filter login events from last 30 days
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        recent_logins = [
-            event for event in events 
-            if event.event_type == "login" and event.timestamp >= thirty_days_ago
-        ]
-        
-        login_count = len(recent_logins)
-        expected_logins = 20  # Expected logins per month for healthy customer
-        
+        # Count login events from last 30 days in a single pass,
+        # tracking the recent 15-day window for trend analysis
+        now = datetime.utcnow()
+        thirty_days_ago = now - timedelta(days=30)
+        fifteen_days_ago = now - timedelta(days=15)
+
+        login_count = 0
+        recent_logins_count = 0
+        for event in events:
+            if event.event_type != "login" or event.timestamp < thirty_days_ago:
+                continue
+            login_count += 1
+            if event.timestamp >= fifteen_days_ago:
+                recent_logins_count += 1
+
+        expected_logins = self.EXPECTED_LOGINS
+
         # Calculate base score
-        score = min(100.0, (login_count / expected_logins) * 100) if expected_logins > 0 else 0
-        
+        score = self._score_logins(login_count)
+
         # Calculate trend (recent 15 days vs previous 15 days)
-        fifteen_days_ago = datetime.utcnow() - timedelta(days=15)
-        recent_15_days = [
-            event for event in recent_logins 
-            if event.timestamp >= fifteen_days_ago
-        ]
-        
-        older_logins = login_count - len(recent_15_days)
-        recent_logins_count = len(recent_15_days)
-        
-        if recent_logins_count > older_logins:
-            trend = "improving"
-        elif recent_logins_count < older_logins:
-            trend = "declining"
-        else:
-            trend = "stable"
+        older_logins = login_count - recent_logins_count
+
+        trend = classify_trend(recent_logins_count, older_logins)
         
         metadata = {
             "expected_logins": expected_logins,
@@ -28,41 +28,28 @@ class PaymentTimelinessFactor(HealthFactor):
     def calculate_score(self, customer: Customer, events: List[CustomerEvent]) -> FactorScore:
         """Calculate payment timeliness score based on payment history"""
         
-        # Filter payment events from last 90 days
+        # Filter payment events from last 90 days and analyze payment
+        # patterns in a single pass, without materializing an event list
         ninety_days_ago = datetime.utcnow() - timedelta(days=90)
-        payment_events = [
-            event for event in events 
-            if event.event_type == "payment" and event.timestamp >= ninety_days_ago
-        ]
-        
-        if not payment_events:
-            # No payment history - neutral score for new customers
-            metadata = {
-                "total_payments": 0,
-                "payment_methods": {},
-                "average_amount": 0
-            }
-            return FactorScore(
-                score=70.0,
-                value=0,
-                description="No recent payment history",
-                metadata=metadata
-            )
-        
-        # Analyze payment patterns
+
+        total_payments = 0
         on_time_payments = 0
         late_payments = 0
         overdue_payments = 0
         failed_payments = 0
         payment_methods = {}
         total_amount = 0
-        
-        for event in payment_events:
+
+        for event in events:
+            if event.event_type != "payment" or event.timestamp < ninety_days_ago:
+                continue
+            total_payments += 1
+
             if event.event_data:
                 status = event.get_payment_status()
                 method = event.event_data.get('method', event.event_data.get('payment_method', 'unknown'))
                 amount = event.event_data.get('amount', 0)
-                
+
                 # Treat "completed" and "paid_on_time" as successful payments
                 if status in ['paid_on_time', 'completed']:
                     on_time_payments += 1
@@ -72,11 +59,23 @@ class PaymentTimelinessFactor(HealthFactor):
                     overdue_payments += 1
                 elif status == 'failed':
                     failed_payments += 1
-                
+
                 payment_methods[method] = payment_methods.get(method, 0) + 1
                 total_amount += amount
-        
-        total_payments = len(payment_events)
+
+        if total_payments == 0:
+            # No payment history - neutral score for new customers
+            metadata = {
+                "total_payments": 0,
+                "payment_methods": {},
+                "average_amount": 0
+            }
+            return FactorScore(
+                score=70.0,
+                value=0,
+                description="No recent payment history",
+                metadata=metadata
+            )
         on_time_percentage = (on_time_payments / total_payments) * 100 if total_payments > 0 else 0
         average_amount = total_amount / total_payments if total_payments > 0 else 0
         
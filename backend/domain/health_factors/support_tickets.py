@@ -28,24 +28,23 @@ class SupportTicketsFactor(HealthFactor):
     def calculate_score(self, customer: Customer, events: List[CustomerEvent]) -> FactorScore:
         """Calculate support ticket score (fewer tickets = higher score)"""
         
-        # Filter support ticket events from last 30 days
+        # Filter support ticket events from last 30 days and tally types
+        # and priorities in a single pass, without materializing a list
         thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        ticket_events = [
-            event for event in events 
-            if event.event_type == "support_ticket" and event.timestamp >= thirty_days_ago
-        ]
-        
-        ticket_count = len(ticket_events)
-        
-        # Analyze ticket types and priorities
+
+        ticket_count = 0
         ticket_types = {}
         priorities = {'low': 0, 'medium': 0, 'high': 0, 'urgent': 0}
-        
-        for event in ticket_events:
+
+        for event in events:
+            if event.event_type != "support_ticket" or event.timestamp < thirty_days_ago:
+                continue
+            ticket_count += 1
+
             if event.event_data:
                 ticket_type = event.event_data.get('ticket_type', 'unknown')
                 priority = event.event_data.get('priority', 'medium')
-                
+
                 ticket_types[ticket_type] = ticket_types.get(ticket_type, 0) + 1
                 if priority in priorities:
                     priorities[priority] += 1
@@ -3,18 +3,84 @@ In-Memory Data Store
 Loads all data at startup and keeps it in memory for instant access
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from operator import itemgetter
 from threading import Lock
 import logging
+import os
+
+import orjson
 
 from sqlalchemy.orm import Session
 from data.repositories import CustomerRepository, EventRepository, HealthScoreRepository
 from domain.models import Customer, CustomerEvent, HealthScore
-from domain.calculators import HealthScoreCalculator
+from domain.calculators import HealthScoreCalculator, default_calculator
 
 logger = logging.getLogger(__name__)
 
+# Per-process calculator for pool workers, built lazily on first use
+_worker_calculator: Optional[HealthScoreCalculator] = None
+
+
+def _calculate_score_worker(args):
+    """
+    Score one customer in a pool worker process.
+
+    Module-level so it can be pickled into ProcessPoolExecutor workers.
+    Returns None on failure so one bad customer doesn't abort the batch.
+    """
+    global _worker_calculator
+    if _worker_calculator is None:
+        _worker_calculator = HealthScoreCalculator()
+
+    customer, events = args
+    try:
+        return _worker_calculator.calculate_health_score(customer, events)
+    except Exception:
+        return None
+
+
+class _RWLock:
+    """
+    Simple readers-writer lock: many concurrent readers, exclusive writers.
+
+    The store's workload is dominated by reads (customer listing, dashboard
+    stats, health detail), so serializing every read through one mutex wastes
+    concurrency. Readers share the lock; writers get exclusive access so the
+    calculator always sees a consistent snapshot.
+    """
+
+    def __init__(self):
+        self._readers_lock = Lock()  # protects the reader count
+        self._writer_lock = Lock()   # held by writers, and by readers as a group
+        self._readers = 0
+
+    @contextmanager
+    def read_lock(self):
+        """Acquire shared read access"""
+        with self._readers_lock:
+            self._readers += 1
+            if self._readers == 1:
+                self._writer_lock.acquire()
+        try:
+            yield
+        finally:
+            with self._readers_lock:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._writer_lock.release()
+
+    @contextmanager
+    def write_lock(self):
+        """Acquire exclusive write access"""
+        with self._writer_lock:
+            yield
+
 
 class MemoryStore:
     """
@@ -22,38 +88,103 @@ class MemoryStore:
 
     All API calls serve data from memory for instant response.
     Updates go to both memory and database.
-    """
 
-    _instance = None
-    _lock = Lock()
+    The single shared instance is the module-level `memory_store` created at
+    import time; import that symbol rather than constructing MemoryStore().
+    Module imports are already serialized by the interpreter, so no locking
+    or double-checked singleton machinery is needed around construction.
+    """
 
-    def __new__(cls):
-        if not cls._instance:
-            with cls._lock:
-                if not cls._instance:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    # Number of striped per-customer lock lanes (power of two for cheap masking)
+    LOCK_STRIPES = 64
 
     def __init__(self):
-        if hasattr(self, '_initialized'):
-            return
+        # Thread safety - readers share, writers are exclusive
+        self._data_lock = _RWLock()
 
-        # Thread safety
-        self._data_lock = Lock()
+        # Striped per-customer locks: event ingestion for different customers
+        # touches disjoint per-customer state, so writers only contend when
+        # they hash to the same stripe. The shared _data_lock is still taken
+        # (briefly) for mutations of cross-cutting state, and the DB session
+        # is not thread-safe so database writes serialize on _db_lock
+        self._stripe_locks = [Lock() for _ in range(self.LOCK_STRIPES)]
+        self._db_lock = Lock()
 
         # In-memory data
         self.customers: Dict[int, Customer] = {}
-        self.events: Dict[int, List[CustomerEvent]] = {}  # customer_id -> events
+        # customer_id -> events, newest first; deques make the prepend on
+        # every recorded event O(1) and let pruning pop expired events off
+        # the tail instead of rebuilding the whole list
+        self.events: Dict[int, Deque[CustomerEvent]] = {}
         self.health_scores: Dict[int, HealthScore] = {}  # customer_id -> latest score
 
+        # Incrementally maintained dashboard counters - updated on every
+        # health score write so stats reads are O(1) instead of O(N)
+        self._status_counts: Dict[str, int] = {"healthy": 0, "at_risk": 0, "critical": 0}
+        self._dashboard_cache: Optional[Dict[str, Any]] = None
+
+        # Status -> customer id index, maintained with the counters, so
+        # filtered listings touch only matching customers instead of all
+        self._ids_by_status: Dict[str, set] = {}
+
+        # Precomputed response dicts for the customer list endpoint.
+        # Writes only mark the touched customer dirty; listings rebuild
+        # just the dirty entries, so unrelated writes never invalidate
+        # the whole cache and idle writes cost a set-add
+        self._customer_dicts: Dict[int, Dict[str, Any]] = {}
+        self._customer_dict_dirty: set = set()
+
+        # Materialized listing views keyed by status filter (None = all),
+        # so repeated listing requests between writes reuse the assembled
+        # list instead of re-sorting and re-collecting per request
+        self._customer_list_cache: Dict[Optional[str], List[Dict[str, Any]]] = {}
+
+        # Pre-serialized API response bodies (success envelope included),
+        # so unchanged data skips JSON encoding entirely on the request path
+        self._dashboard_json: Optional[bytes] = None
+        self._customer_list_json: Dict[Optional[str], bytes] = {}
+
+        # Per-customer health detail responses, invalidated per key on
+        # score writes so detail reads between writes skip dict assembly
+        self._health_detail_cache: Dict[int, Dict[str, Any]] = {}
+
         # Utilities
-        self.calculator = HealthScoreCalculator()
+        self.calculator = default_calculator
         self._db_session = None
         self._repos = None
 
-        self._initialized = True
         logger.info("MemoryStore initialized")
 
+    def reset(self) -> None:
+        """Clear all in-memory state (used by tests to start fresh)"""
+        with self._data_lock.write_lock():
+            self.customers = {}
+            self.events = {}
+            self.health_scores = {}
+            self._status_counts = {"healthy": 0, "at_risk": 0, "critical": 0}
+            self._dashboard_cache = None
+            self._ids_by_status = {}
+            self._customer_dicts = {}
+            self._customer_dict_dirty = set()
+            self._customer_list_cache = {}
+            self._dashboard_json = None
+            self._customer_list_json = {}
+            self._health_detail_cache = {}
+            self._db_session = None
+            self._repos = None
+
+    def _lock_for(self, customer_id: int) -> Lock:
+        """
+        Get the striped lock lane for a customer.
+
+        Args:
+            customer_id: Customer whose per-customer state is being mutated
+
+        Returns:
+            Lock: The stripe lock guarding this customer's event ingestion.
+        """
+        return self._stripe_locks[customer_id & (self.LOCK_STRIPES - 1)]
+
     def set_database(self, db: Session):
         """Set database session and repositories"""
         self._db_session = db
@@ -68,26 +199,42 @@ class MemoryStore:
         if not self._repos:
             raise RuntimeError("Database not set. Call set_database() first.")
 
-        with self._data_lock:
+        with self._data_lock.write_lock():
             logger.info("Loading all data into memory...")
             start_time = datetime.utcnow()
 
             # 1. Load all customers
             customers = self._repos['customer'].get_all()
             self.customers = {c.id: c for c in customers}
+            customer_ids = list(self.customers.keys())
 
-            # 2. Load all events (last 90 days for each customer)
-            self.events = {}
-            for customer_id in self.customers.keys():
-                events = self._repos['event'].get_recent_events(customer_id, days=90)
-                self.events[customer_id] = events
+            # 2. Load all events (last 90 days) in one bulk query
+            events_by_customer = self._repos['event'].get_recent_events_bulk(customer_ids, days=90)
+            self.events = {
+                customer_id: deque(events)
+                for customer_id, events in events_by_customer.items()
+            }
 
-            # 3. Load all health scores
+            # 3. Load all health scores in one bulk query
             self.health_scores = {}
-            for customer_id in self.customers.keys():
-                score = self._repos['health_score'].get_latest_by_customer(customer_id)
-                if score:
-                    self.health_scores[customer_id] = score
+            self._status_counts = {"healthy": 0, "at_risk": 0, "critical": 0}
+            self._dashboard_cache = None
+            self._ids_by_status = {}
+            self._customer_dicts = {}
+            scores_by_customer = self._repos['health_score'].get_latest_by_customers(customer_ids)
+            for customer_id, score in scores_by_customer.items():
+                self._set_health_score(customer_id, score)
+
+            # 4. Precompute response dicts for every customer
+            self._customer_dicts = {
+                customer_id: self._build_customer_dict(customer, self.health_scores.get(customer_id))
+                for customer_id, customer in self.customers.items()
+            }
+            self._customer_dict_dirty.clear()
+            self._customer_list_cache = {}
+            self._dashboard_json = None
+            self._customer_list_json = {}
+            self._health_detail_cache = {}
 
             load_time = (datetime.utcnow() - start_time).total_seconds()
 
@@ -96,92 +243,245 @@ class MemoryStore:
                        f"{sum(len(events) for events in self.events.values())} events, "
                        f"{len(self.health_scores)} health scores")
 
+    def _set_health_score(self, customer_id: int, health_score: HealthScore) -> None:
+        """
+        Write a health score into memory, keeping dashboard counters in sync.
+
+        All health score writes must go through this helper so the status
+        counters stay consistent and the cached dashboard payload is
+        invalidated. Callers hold _data_lock where thread safety matters.
+        """
+        old_score = self.health_scores.get(customer_id)
+        if old_score is not None:
+            if old_score.status in self._status_counts:
+                self._status_counts[old_score.status] -= 1
+            ids = self._ids_by_status.get(old_score.status)
+            if ids is not None:
+                ids.discard(customer_id)
+
+        self.health_scores[customer_id] = health_score
+        if health_score.status in self._status_counts:
+            self._status_counts[health_score.status] += 1
+        self._ids_by_status.setdefault(health_score.status, set()).add(customer_id)
+
+        # Invalidate only this customer's precomputed response dict;
+        # listings rebuild dirty entries lazily
+        self._customer_dict_dirty.add(customer_id)
+        self._customer_list_cache.clear()
+        self._customer_list_json.clear()
+        self._health_detail_cache.pop(customer_id, None)
+
+        self._dashboard_cache = None
+        self._dashboard_json = None
+
     def get_all_customers(self, health_status: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all customers with health scores from memory"""
-        result = []
-
-        for customer in self.customers.values():
-            # Filter by health status if requested
-            if health_status:
-                health_score = self.health_scores.get(customer.id)
-                if not health_score or health_score.status != health_status:
-                    continue
-
-            # Get health score
-            health_score = self.health_scores.get(customer.id)
-
-            customer_data = {
-                "id": customer.id,
-                "name": customer.name,
-                "email": customer.email,
-                "company": customer.company,
-                "segment": customer.segment,
-                "created_at": customer.created_at.isoformat() if customer.created_at else None,
-                "last_activity": customer.last_activity.isoformat() if customer.last_activity else None,
-                "health_score": health_score.score if health_score else 0,
-                "health_status": health_score.status if health_score else "unknown"
-            }
-            result.append(customer_data)
+        # The dirty check and the build must happen under one lock
+        # acquisition: a score write landing between them would mark a
+        # customer dirty and this reader would then pin a listing built
+        # from the stale precomputed dict
+        with self._data_lock.read_lock():
+            if not self._customer_dict_dirty:
+                return self._build_customer_list(health_status)
+
+        # Dirty entries need the write lock to flush; build and fill in
+        # the same acquisition so no writer can interleave
+        with self._data_lock.write_lock():
+            self._flush_dirty_customer_dicts()
+            return self._build_customer_list(health_status)
+
+    def get_all_customers_bytes(self, health_status: Optional[str] = None) -> bytes:
+        """
+        Get the customer list as a pre-serialized API response body.
 
+        Returns the JSON bytes of {"success": true, "data": [...]},
+        cached until the underlying data changes, so unchanged listings
+        skip both dict assembly and JSON encoding on the request path.
+        """
+        cached = self._customer_list_json.get(health_status)
+        if cached is not None:
+            return cached
+
+        # Same single-acquisition discipline as get_all_customers: the
+        # dirty re-check, assembly, serialization and cache fill all
+        # happen with writers excluded, so a concurrent score write can
+        # never invalidate between assembly and fill only to have the
+        # fill pin a stale payload afterwards
+        with self._data_lock.read_lock():
+            if not self._customer_dict_dirty:
+                return self._fill_customer_list_json(health_status)
+
+        with self._data_lock.write_lock():
+            self._flush_dirty_customer_dicts()
+            return self._fill_customer_list_json(health_status)
+
+    def _fill_customer_list_json(self, health_status: Optional[str]) -> bytes:
+        """Serialize and cache the listing body; caller holds the data lock"""
+        customers = self._build_customer_list(health_status)
+        body = orjson.dumps({"success": True, "data": customers})
+        self._customer_list_json[health_status] = body
+        return body
+
+    def get_dashboard_stats_bytes(self) -> bytes:
+        """
+        Get dashboard statistics as a pre-serialized API response body.
+
+        Returns the JSON bytes of {"success": true, "data": {...}},
+        cached until any health score write invalidates it.
+        """
+        body = self._dashboard_json
+        if body is not None:
+            return body
+
+        # Build and fill under the read lock so the fill cannot race a
+        # concurrent invalidation (see get_all_customers_bytes)
+        with self._data_lock.read_lock():
+            stats = self._dashboard_cache
+            if stats is None:
+                stats = self._build_dashboard_stats()
+            body = orjson.dumps({"success": True, "data": stats})
+            self._dashboard_json = body
+        return body
+
+    def _flush_dirty_customer_dicts(self) -> None:
+        """Rebuild response dicts for changed customers; caller holds the write lock"""
+        for customer_id in self._customer_dict_dirty:
+            customer = self.customers.get(customer_id)
+            if customer:
+                self._customer_dicts[customer_id] = self._build_customer_dict(
+                    customer, self.health_scores.get(customer_id)
+                )
+            else:
+                self._customer_dicts.pop(customer_id, None)
+        self._customer_dict_dirty.clear()
+
+    def _build_customer_list(self, health_status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Serve precomputed customer dicts; caller holds the read lock"""
+        cached = self._customer_list_cache.get(health_status)
+        if cached is not None:
+            return cached
+
+        if health_status:
+            # Use the status index so only matching customers are touched
+            matching_ids = sorted(self._ids_by_status.get(health_status, ()))
+            result = [
+                self._customer_dicts[customer_id]
+                for customer_id in matching_ids
+                if customer_id in self._customer_dicts
+            ]
+        else:
+            # Ascending id order so keyset pagination can binary-search
+            result = [self._customer_dicts[customer_id]
+                      for customer_id in sorted(self._customer_dicts)]
+
+        self._customer_list_cache[health_status] = result
         return result
 
+    def get_customers_page(self, health_status: Optional[str] = None,
+                           after_id: int = 0, limit: int = 100) -> Dict[str, Any]:
+        """
+        Get a keyset-paginated slice of the customer list.
+
+        The cached listing is ordered by ascending customer id, so the
+        cursor position is found by binary search and only the requested
+        page is copied - response size stays bounded as the customer
+        table grows.
+
+        Args:
+            health_status: Optional status filter ('healthy', 'at_risk', 'critical')
+            after_id: Return customers with id strictly greater than this
+            limit: Maximum number of customers to return
+
+        Returns:
+            Dict with 'customers' (the page) and 'next_cursor' (id to pass
+            as after_id for the next page, or None on the last page).
+        """
+        rows = self.get_all_customers(health_status)
+        start = bisect_right(rows, after_id, key=itemgetter("id")) if after_id else 0
+        page = rows[start:start + limit]
+        next_cursor = page[-1]["id"] if len(page) == limit else None
+        return {"customers": page, "next_cursor": next_cursor}
+
+    def _build_customer_dict(self, customer: Customer,
+                             health_score: Optional[HealthScore]) -> Dict[str, Any]:
+        """Build the serialized customer dict served by the list endpoint"""
+        return {
+            "id": customer.id,
+            "name": customer.name,
+            "email": customer.email,
+            "company": customer.company,
+            "segment": customer.segment,
+            "created_at": customer.created_at.isoformat() if customer.created_at else None,
+            "last_activity": customer.last_activity.isoformat() if customer.last_activity else None,
+            "health_score": health_score.score if health_score else 0,
+            "health_status": health_score.status if health_score else "unknown"
+        }
+
     def get_customer_by_id(self, customer_id: int) -> Optional[Customer]:
         """Get customer by ID from memory"""
         return self.customers.get(customer_id)
 
     def get_customer_health_detail(self, customer_id: int) -> Dict[str, Any]:
         """Get customer health detail from memory"""
-        customer = self.customers.get(customer_id)
-        if not customer:
-            return None
+        # Served from the per-customer cache between writes; score writes
+        # (which every event triggers) invalidate just the touched customer
+        cached = self._health_detail_cache.get(customer_id)
+        if cached is not None:
+            return cached
 
-        events = self.events.get(customer_id, [])
-        health_score = self.health_scores.get(customer_id)
+        with self._data_lock.read_lock():
+            customer = self.customers.get(customer_id)
+            if not customer:
+                return None
 
-        if not health_score:
-            return None
+            events = self.events.get(customer_id, [])
+            health_score = self.health_scores.get(customer_id)
 
-        return {
-            "customer_id": customer.id,
-            "customer_name": customer.name,
-            "overall_score": health_score.score,
-            "status": health_score.status,
-            "factors": {
-                name: {
-                    "score": factor.score,
-                    "value": factor.value,
-                    "description": factor.description,
-                    "trend": factor.trend,
-                    **factor.metadata
+            if not health_score:
+                return None
+
+            detail = {
+                "customer_id": customer.id,
+                "customer_name": customer.name,
+                "overall_score": health_score.score,
+                "status": health_score.status,
+                "factors": {
+                    name: factor.serialized
+                    for name, factor in health_score.factors.items()
+                },
+                "calculated_at": health_score.calculated_at.isoformat() if health_score.calculated_at else None,
+                "recommendations": health_score.recommendations,
+                "data_summary": {
+                    "events_analyzed": len(events),
+                    "customer_segment": customer.segment
                 }
-                for name, factor in health_score.factors.items()
-            },
-            "calculated_at": health_score.calculated_at.isoformat() if health_score.calculated_at else None,
-            "recommendations": health_score.recommendations,
-            "data_summary": {
-                "events_analyzed": len(events),
-                "customer_segment": customer.segment
             }
-        }
+
+            # Fill while still holding the read lock so a concurrent score
+            # write cannot invalidate this entry between assembly and fill
+            self._health_detail_cache[customer_id] = detail
+
+        return detail
 
     def get_dashboard_stats(self) -> Dict[str, Any]:
-        """Get dashboard statistics from memory"""
+        """Get dashboard statistics from incrementally maintained counters"""
+        cached = self._dashboard_cache
+        if cached is not None:
+            return cached
+
+        with self._data_lock.read_lock():
+            return self._build_dashboard_stats()
+
+    def _build_dashboard_stats(self) -> Dict[str, Any]:
+        """Assemble and cache the stats dict; caller holds the read lock"""
         total_customers = len(self.customers)
-        healthy_customers = 0
-        at_risk_customers = 0
-        critical_customers = 0
-
-        for health_score in self.health_scores.values():
-            if health_score.status == "healthy":
-                healthy_customers += 1
-            elif health_score.status == "at_risk":
-                at_risk_customers += 1
-            elif health_score.status == "critical":
-                critical_customers += 1
+        healthy_customers = self._status_counts["healthy"]
+        at_risk_customers = self._status_counts["at_risk"]
+        critical_customers = self._status_counts["critical"]
 
         total_with_scores = healthy_customers + at_risk_customers + critical_customers
 
-        return {
+        self._dashboard_cache = {
             "total_customers": total_customers,
             "healthy_customers": healthy_customers,
             "at_risk_customers": at_risk_customers,
@@ -193,6 +493,7 @@ class MemoryStore:
             },
             "last_updated": datetime.utcnow().isoformat()
         }
+        return self._dashboard_cache
 
     def add_customer_event(self, customer_id: int, event_type: str,
                           event_data: Dict[str, Any], timestamp: datetime = None) -> Dict[str, Any]:
@@ -206,47 +507,55 @@ class MemoryStore:
         if not customer:
             raise ValueError(f"Customer {customer_id} not found")
 
-        timestamp = timestamp or datetime.utcnow()
-
-        with self._data_lock:
-            # 1. Save to database
-            saved_event = self._repos['event'].create_event(
-                customer_id=customer_id,
-                event_type=event_type,
-                event_data=event_data,
-                timestamp=timestamp
-            )
-
-            # 2. Update customer last activity in database
-            self._repos['customer'].update_last_activity(customer_id, timestamp)
-
-            # 3. Update memory - add event
-            if customer_id not in self.events:
-                self.events[customer_id] = []
-            self.events[customer_id].insert(0, saved_event)  # Add at beginning
-
-            # Keep only last 90 days in memory
-            cutoff_date = datetime.utcnow() - timedelta(days=90)
-            self.events[customer_id] = [
-                e for e in self.events[customer_id]
-                if e.timestamp >= cutoff_date
-            ]
-
-            # 4. Update customer last activity in memory
-            customer.last_activity = timestamp
-
-            # 5. Recalculate health score
-            events = self.events[customer_id]
+        # Read the clock once per operation; the prune cutoff below reuses it
+        now = datetime.utcnow()
+        timestamp = timestamp or now
+
+        # Per-customer stripe lock orders concurrent events for the same
+        # customer; events for different customers proceed in parallel, with
+        # the shared write lock held only for the short memory mutations
+        with self._lock_for(customer_id):
+            # 1. Save event and last-activity touch to database in one
+            #    transaction (session is shared, so DB writes serialize)
+            with self._db_lock:
+                saved_event = self._repos['event'].create_event_and_touch_customer(
+                    customer_id=customer_id,
+                    event_type=event_type,
+                    event_data=event_data,
+                    timestamp=timestamp
+                )
+
+            with self._data_lock.write_lock():
+                # 2. Update memory - prepend event (deque makes this O(1))
+                customer_events = self.events.setdefault(customer_id, deque())
+                customer_events.appendleft(saved_event)
+
+                # Keep only last 90 days in memory: events are ordered newest
+                # first, so expired ones sit at the tail and pruning pops just
+                # those instead of rebuilding the whole list
+                cutoff_date = now - timedelta(days=90)
+                while customer_events and customer_events[-1].timestamp < cutoff_date:
+                    customer_events.pop()
+
+                # 3. Update customer last activity in memory
+                customer.last_activity = timestamp
+
+                # Snapshot the events so scoring can run outside the shared lock
+                events = tuple(customer_events)
+
+            # 4. Recalculate health score (CPU-bound, runs concurrently per stripe)
             new_health_score = self.calculator.calculate_health_score(customer, events)
 
-            # 6. Save health score to database
-            saved_health_score = self._repos['health_score'].save_health_score(new_health_score)
+            # 5. Save health score to database
+            with self._db_lock:
+                saved_health_score = self._repos['health_score'].save_health_score(new_health_score)
 
-            # 7. Update health score in memory
-            self.health_scores[customer_id] = saved_health_score
+            # 6. Update health score in memory (keeps dashboard counters in sync)
+            with self._data_lock.write_lock():
+                self._set_health_score(customer_id, saved_health_score)
 
-            logger.info(f"Added {event_type} event for customer {customer_id}, "
-                       f"new health score: {saved_health_score.score}")
+            logger.debug("Added %s event for customer %s, new health score: %s",
+                         event_type, customer_id, saved_health_score.score)
 
             return {
                 "message": "Event recorded successfully",
@@ -261,52 +570,65 @@ class MemoryStore:
 
     def get_customer_events(self, customer_id: int, days: int = 90) -> List[Dict[str, Any]]:
         """Get customer events from memory"""
-        events = self.events.get(customer_id, [])
-
-        # Filter by days if different from default 90
-        if days != 90:
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
-            events = [e for e in events if e.timestamp >= cutoff_date]
-
-        return [
-            {
-                "id": event.id,
-                "event_type": event.event_type,
-                "event_data": event.event_data,
-                "timestamp": event.timestamp.isoformat() if event.timestamp else None
-            }
-            for event in events
-        ]
+        with self._data_lock.read_lock():
+            events = self.events.get(customer_id, [])
+
+            # Filter by days if different from default 90
+            if days != 90:
+                cutoff_date = datetime.utcnow() - timedelta(days=days)
+                events = [e for e in events if e.timestamp >= cutoff_date]
+
+            return [
+                {
+                    "id": event.id,
+                    "event_type": event.event_type,
+                    "event_data": event.event_data,
+                    "timestamp": event.iso_timestamp
+                }
+                for event in events
+            ]
 
     def recalculate_all_health_scores(self) -> int:
         """Recalculate all health scores and update both memory and database"""
         if not self._repos:
             raise RuntimeError("Database not set")
 
-        processed_count = 0
-
-        with self._data_lock:
-            for customer_id, customer in self.customers.items():
-                try:
-                    events = self.events.get(customer_id, [])
-
-                    # Calculate new health score
-                    health_score = self.calculator.calculate_health_score(customer, events)
-
-                    # Save to database
-                    saved_score = self._repos['health_score'].save_health_score(health_score)
-
-                    # Update memory
-                    self.health_scores[customer_id] = saved_score
-
-                    processed_count += 1
-
-                except Exception as e:
-                    logger.error(f"Failed to recalculate health score for customer {customer_id}: {e}")
-                    continue
+        # 1. Snapshot the work under the read lock - each customer's
+        # calculation is independent of the others
+        with self._data_lock.read_lock():
+            work = [
+                (customer, self.events.get(customer_id, []))
+                for customer_id, customer in self.customers.items()
+            ]
 
-        logger.info(f"Recalculated health scores for {processed_count} customers")
-        return processed_count
+        if not work:
+            return 0
+
+        # 2. Score customers in parallel across processes; the calculator is
+        # CPU-bound pure Python, so a process pool sidesteps the GIL. Fall
+        # back to in-process scoring where worker processes are unavailable.
+        try:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                scores = list(executor.map(_calculate_score_worker, work, chunksize=16))
+        except (OSError, PermissionError):
+            logger.warning("Process pool unavailable - recalculating health scores in-process")
+            scores = [_calculate_score_worker(args) for args in work]
+
+        new_scores = [score for score in scores if score is not None]
+        failed_count = len(scores) - len(new_scores)
+        if failed_count:
+            logger.error(f"Failed to recalculate health scores for {failed_count} customers")
+
+        # 3. Persist all scores in one transaction
+        saved_scores = self._repos['health_score'].save_health_scores_bulk(new_scores)
+
+        # 4. Update memory under a single write-lock acquisition
+        with self._data_lock.write_lock():
+            for saved_score in saved_scores:
+                self._set_health_score(saved_score.customer_id, saved_score)
+
+        logger.info(f"Recalculated health scores for {len(saved_scores)} customers")
+        return len(saved_scores)
 
 
 # Global instance
@@ -38,10 +38,48 @@ Layer: Domain Layer (Clean Architecture)
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from enum import Enum
+from sys import intern
 
 
-@dataclass
+# Interned canonical spellings of the known status strings
+_CANONICAL_STATUSES = {
+    name: intern(name)
+    for name in ("unknown", "healthy", "at_risk", "critical")
+}
+
+
+def canonical_status(name: Optional[str]) -> Optional[str]:
+    """
+    Return the interned canonical spelling of a status string.
+
+    Status strings loaded from the database are fresh objects; swapping
+    them for the interned canonical instances lets the frequent equality
+    checks against status literals short-circuit on identity.
+
+    Args:
+        name: Status string to canonicalize
+
+    Returns:
+        Optional[str]: Interned canonical string, or the input unchanged
+            if it is None or not a known status
+    """
+    return _CANONICAL_STATUSES.get(name, name)
+
+
+def _factor_score_key(item: tuple) -> float:
+    """Sort key for (name, FactorScore) pairs: the factor's score"""
+    return item[1].score
+
+
+# Expected monthly API calls by (lower-cased) customer segment
+_SEGMENT_EXPECTED_API_CALLS = {
+    "enterprise": 1000,
+    "smb": 500,
+    "startup": 200
+}
+
+
+@dataclass(slots=True)
 class Customer:
     """Customer domain entity"""
     id: int
@@ -55,30 +93,46 @@ class Customer:
     plan_type: str = "basic"
     created_at: Optional[datetime] = None
     last_activity: Optional[datetime] = None
-    
+    # Lower-cased segment, normalized once at construction
+    _segment_lc: str = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        """
+        Post-initialization setup.
+
+        Normalizes the segment spelling once so the segment checks invoked
+        per scoring pass avoid allocating a fresh lower-cased string each call.
+        """
+        self._segment_lc = self.segment.lower()
+
     def is_enterprise(self) -> bool:
         """
         Check if customer is enterprise segment.
-        
+
         Returns:
             bool: True if customer segment is 'enterprise' (case insensitive)
         """
-        return self.segment.lower() == "enterprise"
+        return self._segment_lc == "enterprise"
     
-    def is_new_customer(self, days: int = 30) -> bool:
+    def is_new_customer(self, days: int = 30, *, now: Optional[datetime] = None) -> bool:
         """
         Check if customer is new (created within specified days).
-        
+
         Args:
             days (int): Number of days to consider as 'new'. Defaults to 30.
-            
+            now (Optional[datetime]): Reference time; callers iterating many
+                customers should pass a precomputed value to avoid reading
+                the clock per check. Defaults to the current time.
+
         Returns:
-            bool: True if customer was created within the specified days, 
+            bool: True if customer was created within the specified days,
                   False if created_at is None or customer is older than specified days.
         """
         if not self.created_at:
             return False
-        return (datetime.utcnow() - self.created_at).days <= days
+        if now is None:
+            now = datetime.utcnow()
+        return (now - self.created_at).days <= days
     
     def get_expected_api_calls(self) -> int:
         """
@@ -91,15 +145,10 @@ class Customer:
                  - Startup: 200 calls
                  - Default: 300 calls for unknown segments
         """
-        expectations = {
-            "enterprise": 1000,
-            "smb": 500,
-            "startup": 200
-        }
-        return expectations.get(self.segment.lower(), 300)
+        return _SEGMENT_EXPECTED_API_CALLS.get(self._segment_lc, 300)
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomerEvent:
     """Customer event domain entity"""
     id: Optional[int]
@@ -107,18 +156,41 @@ class CustomerEvent:
     event_type: str
     event_data: Dict[str, Any]
     timestamp: datetime
-    
-    def is_recent(self, days: int = 30) -> bool:
+    # Lazily cached ISO rendering of timestamp; see iso_timestamp
+    _iso_timestamp: Optional[str] = field(default=None, repr=False, compare=False)
+
+    @property
+    def iso_timestamp(self) -> Optional[str]:
+        """
+        ISO-8601 rendering of the event timestamp, computed once.
+
+        The timestamp never changes after creation, so serialization paths
+        that render the same events repeatedly reuse the cached string
+        instead of paying isoformat() per request.
+
+        Returns:
+            Optional[str]: ISO timestamp string, or None if timestamp is unset.
+        """
+        if self._iso_timestamp is None and self.timestamp is not None:
+            self._iso_timestamp = self.timestamp.isoformat()
+        return self._iso_timestamp
+
+    def is_recent(self, days: int = 30, *, now: Optional[datetime] = None) -> bool:
         """
         Check if event occurred within specified days.
-        
+
         Args:
             days (int): Number of days to consider as 'recent'. Defaults to 30.
-            
+            now (Optional[datetime]): Reference time; callers iterating many
+                events should pass a precomputed value to avoid reading the
+                clock per check. Defaults to the current time.
+
         Returns:
             bool: True if event timestamp is within the specified days from now.
         """
-        return (datetime.utcnow() - self.timestamp).days <= days
+        if now is None:
+            now = datetime.utcnow()
+        return (now - self.timestamp).days <= days
     
     def get_feature_name(self) -> Optional[str]:
         """
@@ -145,7 +217,7 @@ class CustomerEvent:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class FactorScore:
     """Value object for health factor scores"""
     score: float
@@ -153,11 +225,13 @@ class FactorScore:
     description: str
     trend: Optional[str] = None
     metadata: Dict[str, Any] = None
-    
+    # Merged serialization dict, built once at construction; see serialized
+    _serialized: Dict[str, Any] = field(default=None, repr=False, compare=False)
+
     def __post_init__(self):
         """
         Post-initialization validation and setup.
-        
+
         Raises:
             ValueError: If score is not between 0 and 100.
         """
@@ -165,9 +239,28 @@ class FactorScore:
             self.metadata = {}
         if not 0 <= self.score <= 100:
             raise ValueError(f"Score must be between 0 and 100, got {self.score}")
+        # Factor scores are effectively immutable once calculated, so the
+        # known-keys + metadata merge is paid here instead of per request
+        self._serialized = {
+            "score": self.score,
+            "value": self.value,
+            "description": self.description,
+            "trend": self.trend,
+            **self.metadata
+        }
 
+    @property
+    def serialized(self) -> Dict[str, Any]:
+        """
+        Merged score and metadata dict used for API and database serialization.
 
-@dataclass
+        Returns:
+            Dict[str, Any]: Known factor fields merged with metadata, built once.
+        """
+        return self._serialized
+
+
+@dataclass(slots=True)
 class HealthScore:
     """Health score domain entity"""
     id: Optional[int]
@@ -177,17 +270,27 @@ class HealthScore:
     factors: Dict[str, FactorScore]
     recommendations: List[str]
     calculated_at: datetime
-    
+    # Extreme factors, computed once at construction; see get_lowest_factor
+    _min_factor: Optional[tuple] = field(default=None, repr=False, compare=False)
+    _max_factor: Optional[tuple] = field(default=None, repr=False, compare=False)
+
     def __post_init__(self):
         """
-        Post-initialization validation.
-        
+        Post-initialization validation and setup.
+
         Raises:
             ValueError: If overall health score is not between 0 and 100.
         """
         if not 0 <= self.score <= 100:
             raise ValueError(f"Health score must be between 0 and 100, got {self.score}")
-    
+        # A health score is a snapshot - factors never change after
+        # construction, so the min/max walk happens once here instead of
+        # on every accessor call
+        if self.factors:
+            items = self.factors.items()
+            self._min_factor = min(items, key=_factor_score_key)
+            self._max_factor = max(items, key=_factor_score_key)
+
     def is_healthy(self) -> bool:
         """
         Check if customer is in healthy status.
@@ -226,7 +329,9 @@ class HealthScore:
         Raises:
             ValueError: If no factors are present.
         """
-        return min(self.factors.items(), key=lambda x: x[1].score)
+        if self._min_factor is None:
+            raise ValueError("min() arg is an empty sequence")
+        return self._min_factor
     
     def get_highest_factor(self) -> tuple[str, FactorScore]:
         """
@@ -239,4 +344,6 @@ class HealthScore:
         Raises:
             ValueError: If no factors are present.
         """
-        return max(self.factors.items(), key=lambda x: x[1].score)
\ No newline at end of file
+        if self._max_factor is None:
+            raise ValueError("max() arg is an empty sequence")
+        return self._max_factor
\ No newline at end of file
@@ -2,22 +2,82 @@
 Sample data generation for the application
 """
 
+import os
 import random
 import json
 from datetime import datetime, timedelta
-from faker import Faker
+from types import SimpleNamespace
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 # Import database models
 from data.models import Customer, CustomerEvent
 
-fake = Faker()
-Faker.seed(42)  # For reproducible data
-random.seed(42)
+# Rows per bulk insert statement - keeps memory and statement size bounded
+# while still amortizing round-trip and commit cost over large batches
+BATCH_SIZE = int(os.getenv("SAMPLE_DATA_BATCH_SIZE", "2000"))
+
+# Daily event probabilities per health profile, with activity dropping
+# to 30% on weekends
+EVENT_PROBABILITIES = {
+    "login": {"healthy": 0.8, "at_risk": 0.4, "critical": 0.15},
+    "feature_use": {"healthy": 0.7, "at_risk": 0.3, "critical": 0.1},
+    "support_ticket": {"healthy": 0.05, "at_risk": 0.15, "critical": 0.3},
+    "api_call": {"healthy": 0.9, "at_risk": 0.6, "critical": 0.2}
+}
+WEEKEND_FACTOR = 0.3
+
+# Pre-drawn pool of source addresses for login events. Faker's ipv4() goes
+# through provider/locale machinery; plausible addresses only need four
+# random octets. Faker stays for the 55 customer-level names/emails/companies
+# where call count is negligible. A dedicated Random instance keeps the pool
+# reproducible without touching the global seed at import time.
+_ip_rng = random.Random(42)
+IP_POOL = tuple(
+    "{}.{}.{}.{}".format(
+        _ip_rng.randint(1, 254), _ip_rng.randint(0, 255),
+        _ip_rng.randint(0, 255), _ip_rng.randint(1, 254)
+    )
+    for _ in range(256)
+)
+
+# Categorical pools used in the generation loop - built once at module
+# scope instead of as fresh list literals on every iteration
+FEATURES = (
+    "dashboard", "analytics", "reports", "user_management",
+    "api_keys", "integrations", "billing", "notifications",
+    "advanced_search", "export_data", "collaboration", "automation"
+)
+FEATURES_CORE = FEATURES[:4]  # The only features critical customers touch
+API_ENDPOINTS = (
+    "/api/users", "/api/data", "/api/analytics", "/api/reports",
+    "/api/integrations", "/api/webhooks", "/api/billing"
+)
+HTTP_METHODS = ("GET", "POST", "PUT", "DELETE")
+RESPONSE_CODES = (200, 201, 400, 401, 500)
+RESPONSE_CODE_WEIGHTS = (0.7, 0.1, 0.1, 0.05, 0.05)
+TICKET_TYPES = ("bug_report", "feature_request", "billing_question", "technical_issue", "account_help")
+TICKET_STATUSES = ("open", "in_progress", "resolved")
+PAYMENT_METHODS = ("credit_card", "bank_transfer", "check")
+PRIORITIES = ("low", "medium", "high", "urgent")
+PRIORITY_WEIGHTS = {
+    "healthy": (0.4, 0.4, 0.15, 0.05),
+    "at_risk": (0.2, 0.3, 0.3, 0.2),
+    "critical": (0.1, 0.2, 0.4, 0.3)
+}
 
 def populate_sample_data(db: Session):
     """Generate realistic sample data for 50+ customers with 3+ months of history"""
-    
+
+    # Faker is only needed while seeding runs; importing and seeding it here
+    # keeps provider initialization and the global RNG seed off the import
+    # path of processes that never populate data
+    from faker import Faker
+
+    Faker.seed(42)  # For reproducible data
+    random.seed(42)
+    fake = Faker()
+
     # Company data for realistic customer profiles
     companies_data = [
         # Enterprise customers
@@ -42,7 +102,7 @@ def populate_sample_data(db: Session):
         {"name": "Green Energy Epsilon", "segment": "startup", "industry": "Energy", "employees": 10, "revenue": 600},
     ]
     
-    customers = []
+    customer_rows = []
     start_date = datetime.utcnow() - timedelta(days=120)  # 4 months of history
     
     # Create diverse customer base (50+ customers)
@@ -60,7 +120,7 @@ def populate_sample_data(db: Session):
             }
         
         # Create customer with realistic data
-        customer = Customer(
+        customer_rows.append(dict(
             name=fake.name(),
             email=fake.email(),
             company=company_info["name"],
@@ -71,18 +131,42 @@ def populate_sample_data(db: Session):
             plan_type=_get_plan_type(company_info["segment"]),
             created_at=start_date + timedelta(days=random.randint(0, 30)),
             last_activity=datetime.utcnow() - timedelta(days=random.randint(0, 7))
-        )
-        
-        db.add(customer)
-        customers.append(customer)
-    
-    # Commit customers first to get IDs
-    db.commit()
-    
-    # Generate realistic event history for each customer
+        ))
+
+    # Insert all customers in one statement and collect the generated IDs
+    # from RETURNING, instead of committing mid-seed just to materialize
+    # customer.id on ORM instances
+    result = db.execute(
+        insert(Customer).returning(Customer.id, sort_by_parameter_order=True),
+        customer_rows
+    )
+    customers = [
+        SimpleNamespace(id=customer_id, **row)
+        for (customer_id,), row in zip(result, customer_rows)
+    ]
+
+    # Generate realistic event history for each customer, then insert all
+    # events in one bulk statement - per-row db.add() pays identity-map and
+    # autoflush overhead for tens of thousands of rows we never read back
+    # The day schedule and weekend mask are identical for every customer,
+    # so build them once here instead of per customer
+    end_date = datetime.utcnow()
+    dates = []
+    current_date = start_date
+    while current_date < end_date:
+        dates.append(current_date)
+        current_date += timedelta(days=1)
+    weekend = [d.weekday() >= 5 for d in dates]
+
+    all_events = []
     for customer in customers:
-        _generate_customer_events(db, customer, start_date)
-    
+        health_profile = _determine_health_profile(customer)
+        all_events.extend(_generate_customer_events(customer, dates, weekend, health_profile))
+
+    # Core insert executemany path - seeding needs no identity tracking or
+    # unit-of-work bookkeeping, matching the customer insert above
+    for start in range(0, len(all_events), BATCH_SIZE):
+        db.execute(insert(CustomerEvent), all_events[start:start + BATCH_SIZE])
     db.commit()
 
 def _get_plan_type(segment: str) -> str:
@@ -94,44 +178,44 @@ def _get_plan_type(segment: str) -> str:
     else:  # startup
         return random.choice(["basic", "pro"])
 
-def _generate_customer_events(db: Session, customer: Customer, start_date: datetime):
-    """Generate realistic event history for a customer"""
-    
-    # Determine customer health profile (affects event generation)
-    health_profile = _determine_health_profile(customer)
-    
-    current_date = start_date
-    end_date = datetime.utcnow()
-    
+def _generate_customer_events(customer: Customer, dates: list, weekend: list, health_profile: str) -> list:
+    """Generate realistic event history for a customer as plain row dicts"""
+
+    events = []
+
+    # Draw each event type's "fires today" flags in a single pass instead
+    # of re-deriving probabilities day by day
+    fires = _daily_event_flags(health_profile, weekend)
+
+    # Monthly billing days resolved up front alongside the other day flags,
+    # instead of re-reading customer.created_at on every iteration
+    created_at = customer.created_at
+    billing_day = created_at.day
+    payment_due = [d.day == billing_day and d >= created_at for d in dates]
+
     # Generate events over time
-    while current_date < end_date:
+    for day, current_date in enumerate(dates):
         # Login events - frequency based on health profile
-        if _should_generate_event(health_profile, "login", current_date):
-            db.add(CustomerEvent(
+        if fires["login"][day]:
+            events.append(dict(
                 customer_id=customer.id,
                 event_type="login",
-                event_data={"ip_address": fake.ipv4(), "user_agent": "web"},
+                event_data={"ip_address": random.choice(IP_POOL), "user_agent": "web"},
                 timestamp=current_date + timedelta(hours=random.randint(8, 18))
             ))
-        
+
         # Feature usage events
-        if _should_generate_event(health_profile, "feature_use", current_date):
-            features = [
-                "dashboard", "analytics", "reports", "user_management", 
-                "api_keys", "integrations", "billing", "notifications",
-                "advanced_search", "export_data", "collaboration", "automation"
-            ]
-            
+        if fires["feature_use"][day]:
             # Healthy customers use more diverse features
             if health_profile == "healthy":
-                selected_features = random.sample(features, random.randint(2, 5))
+                selected_features = random.sample(FEATURES, random.randint(2, 5))
             elif health_profile == "at_risk":
-                selected_features = random.sample(features, random.randint(1, 3))
+                selected_features = random.sample(FEATURES, random.randint(1, 3))
             else:  # critical
-                selected_features = random.sample(features[:4], random.randint(1, 2))
+                selected_features = random.sample(FEATURES_CORE, random.randint(1, 2))
             
             for feature in selected_features:
-                db.add(CustomerEvent(
+                events.append(dict(
                     customer_id=customer.id,
                     event_type="feature_use",
                     event_data={"feature_name": feature, "duration_minutes": random.randint(2, 30)},
@@ -139,70 +223,62 @@ def _generate_customer_events(db: Session, customer: Customer, start_date: datet
                 ))
         
         # Support ticket events
-        if _should_generate_event(health_profile, "support_ticket", current_date):
-            ticket_types = ["bug_report", "feature_request", "billing_question", "technical_issue", "account_help"]
-            priorities = ["low", "medium", "high", "urgent"]
-            
-            priority_weights = {
-                "healthy": [0.4, 0.4, 0.15, 0.05],
-                "at_risk": [0.2, 0.3, 0.3, 0.2],
-                "critical": [0.1, 0.2, 0.4, 0.3]
-            }
-            
-            db.add(CustomerEvent(
+        if fires["support_ticket"][day]:
+            events.append(dict(
                 customer_id=customer.id,
                 event_type="support_ticket",
                 event_data={
-                    "ticket_type": random.choice(ticket_types),
-                    "priority": random.choices(priorities, weights=priority_weights[health_profile])[0],
-                    "status": random.choice(["open", "in_progress", "resolved"])
+                    "ticket_type": random.choice(TICKET_TYPES),
+                    "priority": random.choices(PRIORITIES, weights=PRIORITY_WEIGHTS[health_profile])[0],
+                    "status": random.choice(TICKET_STATUSES)
                 },
                 timestamp=current_date + timedelta(hours=random.randint(10, 16))
             ))
-        
+
         # Payment events - monthly billing cycles
-        if current_date.day == customer.created_at.day and current_date >= customer.created_at:
+        if payment_due[day]:
             payment_status = _get_payment_status(health_profile)
             
-            db.add(CustomerEvent(
+            events.append(dict(
                 customer_id=customer.id,
                 event_type="payment",
                 event_data={
                     "amount": customer.monthly_revenue,
                     "status": payment_status,
-                    "payment_method": random.choice(["credit_card", "bank_transfer", "check"]),
+                    "payment_method": random.choice(PAYMENT_METHODS),
                     "invoice_id": f"INV-{random.randint(10000, 99999)}"
                 },
                 timestamp=current_date + timedelta(hours=random.randint(1, 5))
             ))
         
         # API usage events
-        if _should_generate_event(health_profile, "api_call", current_date):
-            api_endpoints = [
-                "/api/users", "/api/data", "/api/analytics", "/api/reports",
-                "/api/integrations", "/api/webhooks", "/api/billing"
-            ]
-            
-            # Generate multiple API calls per day for active customers
+        if fires["api_call"][day]:
+            # Generate multiple API calls per day for active customers,
+            # drawing each random field for the whole day in one batch
+            # instead of one scalar RNG call per field per event
             num_calls = _get_api_calls_per_day(customer.segment, health_profile)
-            
-            for _ in range(num_calls):
-                db.add(CustomerEvent(
+
+            endpoints = random.choices(API_ENDPOINTS, k=num_calls)
+            methods = random.choices(HTTP_METHODS, k=num_calls)
+            response_codes = random.choices(RESPONSE_CODES, weights=RESPONSE_CODE_WEIGHTS, k=num_calls)
+            response_times = random.choices(range(50, 2001), k=num_calls)
+            hours = random.choices(range(0, 24), k=num_calls)
+            minutes = random.choices(range(0, 60), k=num_calls)
+
+            for i in range(num_calls):
+                events.append(dict(
                     customer_id=customer.id,
                     event_type="api_call",
                     event_data={
-                        "endpoint": random.choice(api_endpoints),
-                        "method": random.choice(["GET", "POST", "PUT", "DELETE"]),
-                        "response_code": random.choices([200, 201, 400, 401, 500], weights=[0.7, 0.1, 0.1, 0.05, 0.05])[0],
-                        "response_time_ms": random.randint(50, 2000)
+                        "endpoint": endpoints[i],
+                        "method": methods[i],
+                        "response_code": response_codes[i],
+                        "response_time_ms": response_times[i]
                     },
-                    timestamp=current_date + timedelta(
-                        hours=random.randint(0, 23),
-                        minutes=random.randint(0, 59)
-                    )
+                    timestamp=current_date + timedelta(hours=hours[i], minutes=minutes[i])
                 ))
-        
-        current_date += timedelta(days=1)
+
+    return events
 
 def _determine_health_profile(customer: Customer) -> str:
     """Determine health profile based on customer characteristics"""
@@ -213,21 +289,17 @@ def _determine_health_profile(customer: Customer) -> str:
     else:  # startup
         return random.choices(["healthy", "at_risk", "critical"], weights=[0.4, 0.4, 0.2])[0]
 
-def _should_generate_event(health_profile: str, event_type: str, current_date: datetime) -> bool:
-    """Determine if an event should be generated"""
-    probabilities = {
-        "login": {"healthy": 0.8, "at_risk": 0.4, "critical": 0.15},
-        "feature_use": {"healthy": 0.7, "at_risk": 0.3, "critical": 0.1},
-        "support_ticket": {"healthy": 0.05, "at_risk": 0.15, "critical": 0.3},
-        "api_call": {"healthy": 0.9, "at_risk": 0.6, "critical": 0.2}
-    }
-    
-    # Weekend adjustments
-    if current_date.weekday() >= 5:
-        for profile in probabilities[event_type]:
-            probabilities[event_type][profile] *= 0.3
-    
-    return random.random() < probabilities[event_type][health_profile]
+def _daily_event_flags(health_profile: str, weekend: list) -> dict:
+    """Draw which days fire each event type, one pass per event type"""
+    flags = {}
+    for event_type, profiles in EVENT_PROBABILITIES.items():
+        probability = profiles[health_profile]
+        weekend_probability = probability * WEEKEND_FACTOR
+        flags[event_type] = [
+            random.random() < (weekend_probability if is_weekend else probability)
+            for is_weekend in weekend
+        ]
+    return flags
 
 def _get_payment_status(health_profile: str) -> str:
     """Get payment status based on health profile"""
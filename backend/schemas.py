@@ -35,7 +35,7 @@ Usage:
 Author: Customer Health Team
 """
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, validator
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 
@@ -53,16 +53,16 @@ class CustomerCreate(CustomerBase):
     plan_type: Optional[str] = "basic"
 
 class CustomerResponse(CustomerBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
+    email: str  # Already validated on ingress; skip EmailStr re-validation
     industry: Optional[str]
     employee_count: Optional[int]
     monthly_revenue: Optional[float]
     plan_type: str
     created_at: datetime
     last_activity: Optional[datetime]
-    
-    class Config:
-        from_attributes = True
 
 class CustomerListResponse(BaseModel):
     id: int
@@ -82,25 +82,23 @@ class CustomerEventCreate(BaseModel):
     timestamp: Optional[datetime] = None
 
 class CustomerEventResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     customer_id: int
     event_type: str
     event_data: Optional[Dict[str, Any]]
     timestamp: datetime
-    
-    class Config:
-        from_attributes = True
 
 # Health score schemas
 class HealthScoreResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     customer_id: int
     score: float
     status: str
     calculated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 class HealthFactorDetail(BaseModel):
     score: float
@@ -61,6 +61,47 @@ class CustomerService:
             health_status=health_status
         )
     
+    def get_customers_payload(self, health_status: Optional[str] = None) -> bytes:
+        """
+        Get customers with health scores as a pre-serialized JSON body.
+
+        Fast path for the list endpoint: returns cached response bytes
+        (success envelope included) so unchanged data skips dict assembly
+        and JSON encoding entirely.
+
+        Args:
+            health_status: Optional health status filter ('healthy', 'at_risk', 'critical')
+
+        Returns:
+            bytes: JSON response body for the customer list endpoint
+        """
+        return self.customer_controller.get_customers_payload(health_status=health_status)
+
+    def get_customers_page(
+        self,
+        health_status: Optional[str] = None,
+        after_id: int = 0,
+        limit: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Get a keyset-paginated page of customers with health scores.
+
+        Bounded alternative to the full listing for large customer tables:
+        returns at most `limit` customers with id greater than `after_id`,
+        plus the cursor for the next page.
+
+        Args:
+            health_status: Optional health status filter ('healthy', 'at_risk', 'critical')
+            after_id: Cursor - return customers with id strictly greater than this
+            limit: Maximum page size
+
+        Returns:
+            Dict[str, Any]: 'customers' page and 'next_cursor' (None on last page)
+        """
+        return self.customer_controller.get_customers_page(
+            health_status=health_status, after_id=after_id, limit=limit
+        )
+
     def get_customer_by_id(self, customer_id: int):
         """
         Get customer by ID.
@@ -26,6 +26,10 @@ class HealthScoreService:
     def get_dashboard_stats(self) -> Dict[str, Any]:
         """Get dashboard statistics"""
         return self.health_score_controller.get_dashboard_statistics()
+
+    def get_dashboard_stats_payload(self) -> bytes:
+        """Get dashboard statistics as a pre-serialized JSON response body"""
+        return self.health_score_controller.get_dashboard_statistics_payload()
     
     def recalculate_all_health_scores(self) -> int:
         """Recalculate health scores for all customers"""
@@ -60,6 +60,19 @@ def setup_database():
         pass
 
 
+@pytest.fixture(autouse=True)
+def reset_memory_store():
+    """Start each test with a clean memory store.
+
+    The store is a module-level singleton, so without this hook state
+    loaded by one test (customers, events, cached payloads) would leak
+    into every later test in the same process.
+    """
+    from domain.memory_store import memory_store
+    memory_store.reset()
+    yield
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """Create a fresh database session for each test"""
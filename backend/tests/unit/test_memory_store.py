@@ -0,0 +1,300 @@
+"""
+Unit tests for MemoryStore
+"""
+import threading
+
+import pytest
+from collections import deque
+from datetime import datetime, timedelta
+
+from data.models import Customer as CustomerModel
+from data.repositories import HealthScoreRepository
+from domain.memory_store import MemoryStore, _RWLock
+from domain.models import Customer, CustomerEvent, FactorScore, HealthScore
+
+
+def _make_customer(customer_id=1, **overrides):
+    """Build a customer domain entity with sensible defaults"""
+    defaults = dict(
+        id=customer_id,
+        name="Test Customer",
+        email="test@example.com",
+        company="Test Company",
+        segment="enterprise",
+        created_at=datetime.utcnow() - timedelta(days=120),
+        last_activity=datetime.utcnow()
+    )
+    defaults.update(overrides)
+    return Customer(**defaults)
+
+
+def _make_event(event_id, customer_id=1, days_ago=0, event_type="login"):
+    """Build an event domain entity timestamped days_ago in the past"""
+    return CustomerEvent(
+        id=event_id,
+        customer_id=customer_id,
+        event_type=event_type,
+        event_data={"source": "test"},
+        timestamp=datetime.utcnow() - timedelta(days=days_ago)
+    )
+
+
+class TestGetCustomerEvents:
+
+    def setup_method(self):
+        """Set up a store with one customer and a few events in memory"""
+        self.store = MemoryStore()
+        self.store.customers = {1: _make_customer(1)}
+        self.store.events = {1: deque([
+            _make_event(3, days_ago=1),
+            _make_event(2, days_ago=10),
+            _make_event(1, days_ago=60),
+        ])}
+
+    def test_default_days_returns_all_events(self):
+        """Regression: the default days=90 path must return the event list"""
+        result = self.store.get_customer_events(1)
+
+        assert result is not None
+        assert [event["id"] for event in result] == [3, 2, 1]
+        assert result[0]["event_type"] == "login"
+        assert result[0]["event_data"] == {"source": "test"}
+
+    def test_custom_days_filters_older_events(self):
+        """Test that a non-default window drops events outside it"""
+        result = self.store.get_customer_events(1, days=30)
+
+        assert [event["id"] for event in result] == [3, 2]
+
+    def test_unknown_customer_returns_empty_list(self):
+        """Test that a customer without events yields an empty list"""
+        assert self.store.get_customer_events(999) == []
+
+
+def _make_health_score(customer_id, score=85.0, status="healthy"):
+    """Build a health score domain entity with one factor"""
+    return HealthScore(
+        id=None,
+        customer_id=customer_id,
+        score=score,
+        status=status,
+        factors={
+            "api_usage": FactorScore(
+                score=score,
+                value=10,
+                description="API usage",
+                trend="stable",
+                metadata={"calls": 10}
+            )
+        },
+        recommendations=["Keep it up"],
+        calculated_at=datetime.utcnow()
+    )
+
+
+def _seed_customer(db, email="store@example.com", segment="enterprise"):
+    """Insert a customer row and return the refreshed model"""
+    customer = CustomerModel(
+        name="Store Customer",
+        email=email,
+        company="Store Co",
+        segment=segment,
+        created_at=datetime.utcnow() - timedelta(days=120),
+        last_activity=datetime.utcnow()
+    )
+    db.add(customer)
+    db.commit()
+    db.refresh(customer)
+    return customer
+
+
+class TestMemoryStoreWithDatabase:
+    """Tests for the database-backed load and write paths"""
+
+    @pytest.fixture
+    def store(self, db_session, clean_db):
+        """A store wired to the test database with two customers loaded"""
+        self.healthy = _seed_customer(db_session, email="healthy@example.com")
+        self.critical = _seed_customer(db_session, email="critical@example.com", segment="startup")
+        score_repo = HealthScoreRepository(db_session)
+        score_repo.save_health_score(_make_health_score(self.healthy.id, score=90.0))
+        score_repo.save_health_score(
+            _make_health_score(self.critical.id, score=20.0, status="critical")
+        )
+
+        store = MemoryStore()
+        store.set_database(db_session)
+        store.load_all_data()
+        return store
+
+    def test_load_all_data_populates_memory(self, store):
+        """Test that customers and scores are loaded into memory"""
+        assert len(store.customers) == 2
+        assert store.health_scores[self.healthy.id].score == 90.0
+        assert store._status_counts == {"healthy": 1, "at_risk": 0, "critical": 1}
+
+    def test_load_all_data_requires_database(self):
+        """Test that loading without a session fails loudly"""
+        with pytest.raises(RuntimeError, match="Database not set"):
+            MemoryStore().load_all_data()
+
+    def test_get_all_customers(self, store):
+        """Test the full listing is served from memory in id order"""
+        customers = store.get_all_customers()
+
+        assert [c["id"] for c in customers] == sorted([self.healthy.id, self.critical.id])
+        assert customers[0]["health_score"] == 90.0
+        assert customers[0]["health_status"] == "healthy"
+
+    def test_get_all_customers_filtered_by_status(self, store):
+        """Test the status index only returns matching customers"""
+        customers = store.get_all_customers(health_status="critical")
+
+        assert [c["id"] for c in customers] == [self.critical.id]
+
+    def test_get_all_customers_bytes_cached(self, store):
+        """Test the pre-serialized listing body is built once and reused"""
+        first = store.get_all_customers_bytes()
+
+        assert isinstance(first, bytes)
+        assert b'"success":true' in first
+        assert store.get_all_customers_bytes() is first
+
+    def test_get_customers_page(self, store):
+        """Test keyset pagination slices the cached listing"""
+        first_page = store.get_customers_page(limit=1)
+
+        assert len(first_page["customers"]) == 1
+        assert first_page["next_cursor"] == first_page["customers"][0]["id"]
+
+        last_page = store.get_customers_page(after_id=first_page["next_cursor"], limit=10)
+        assert len(last_page["customers"]) == 1
+        assert last_page["next_cursor"] is None
+
+    def test_get_customer_by_id(self, store):
+        """Test direct customer lookup from memory"""
+        assert store.get_customer_by_id(self.healthy.id).email == "healthy@example.com"
+        assert store.get_customer_by_id(9999) is None
+
+    def test_get_dashboard_stats(self, store):
+        """Test stats come from the incrementally maintained counters"""
+        stats = store.get_dashboard_stats()
+
+        assert stats["total_customers"] == 2
+        assert stats["healthy_customers"] == 1
+        assert stats["critical_customers"] == 1
+        assert stats["distribution"]["healthy_percent"] == 50.0
+        # Cached until the next score write
+        assert store.get_dashboard_stats() is stats
+
+    def test_get_dashboard_stats_bytes_cached(self, store):
+        """Test the pre-serialized stats body is built once and reused"""
+        body = store.get_dashboard_stats_bytes()
+
+        assert b'"total_customers":2' in body
+        assert store.get_dashboard_stats_bytes() is body
+
+    def test_get_customer_health_detail(self, store):
+        """Test the health detail payload and its per-customer cache"""
+        detail = store.get_customer_health_detail(self.healthy.id)
+
+        assert detail["customer_id"] == self.healthy.id
+        assert detail["overall_score"] == 90.0
+        assert detail["factors"]["api_usage"]["score"] == 90.0
+        assert detail["recommendations"] == ["Keep it up"]
+        assert store.get_customer_health_detail(self.healthy.id) is detail
+
+    def test_get_customer_health_detail_missing(self, store):
+        """Test that an unknown customer yields no detail"""
+        assert store.get_customer_health_detail(9999) is None
+
+    def test_add_customer_event(self, store, db_session):
+        """Test recording an event updates database, memory and score"""
+        result = store.add_customer_event(
+            self.healthy.id, "login", {"ip_address": "10.0.0.1"}
+        )
+
+        assert result["event_id"] is not None
+        assert result["customer_name"] == "Store Customer"
+        assert 0 <= result["new_health_score"] <= 100
+        assert result["new_health_status"] in ("healthy", "at_risk", "critical")
+        # Event is in memory, newest first
+        events = store.get_customer_events(self.healthy.id)
+        assert events[0]["event_type"] == "login"
+        # Score caches were invalidated
+        assert store._dashboard_cache is None
+
+    def test_add_customer_event_unknown_customer(self, store):
+        """Test that events for unknown customers are rejected"""
+        with pytest.raises(ValueError, match="not found"):
+            store.add_customer_event(9999, "login", {})
+
+    def test_add_customer_event_requires_database(self):
+        """Test that recording without a session fails loudly"""
+        with pytest.raises(RuntimeError, match="Database not set"):
+            MemoryStore().add_customer_event(1, "login", {})
+
+    def test_recalculate_all_health_scores(self, store, db_session):
+        """Test the bulk recalculation updates memory and database"""
+        updated = store.recalculate_all_health_scores()
+
+        assert updated == 2
+        repo = HealthScoreRepository(db_session)
+        for customer_id in (self.healthy.id, self.critical.id):
+            saved = repo.get_latest_by_customer(customer_id)
+            assert saved is not None
+            assert saved.score == store.health_scores[customer_id].score
+
+    def test_recalculate_all_health_scores_empty_store(self, store):
+        """Test that an empty store recalculates nothing"""
+        store.customers = {}
+        assert store.recalculate_all_health_scores() == 0
+
+    def test_reset_clears_state(self, store):
+        """Test that reset returns the store to its pristine state"""
+        store.get_all_customers_bytes()
+        store.get_dashboard_stats_bytes()
+
+        store.reset()
+
+        assert store.customers == {}
+        assert store.health_scores == {}
+        assert store._status_counts == {"healthy": 0, "at_risk": 0, "critical": 0}
+        assert store._customer_list_json == {}
+        assert store._dashboard_json is None
+        assert store._repos is None
+
+
+class TestRWLock:
+
+    def test_reader_blocks_writer(self):
+        """Test that an active reader holds the writer lock"""
+        lock = _RWLock()
+        with lock.read_lock():
+            assert lock._readers == 1
+            assert not lock._writer_lock.acquire(blocking=False)
+        assert lock._readers == 0
+        # Writer proceeds once the reader is gone
+        with lock.write_lock():
+            pass
+
+    def test_readers_share_access(self):
+        """Test that multiple readers hold the lock concurrently"""
+        lock = _RWLock()
+        with lock.read_lock():
+            with lock.read_lock():
+                assert lock._readers == 2
+            assert lock._readers == 1
+
+    def test_writer_excludes_other_threads(self):
+        """Test that a writer blocks readers in other threads"""
+        lock = _RWLock()
+        entered = threading.Event()
+        with lock.write_lock():
+            reader = threading.Thread(
+                target=lambda: (lock.read_lock().__enter__(), entered.set())
+            )
+            reader.start()
+            assert not entered.wait(timeout=0.1)
+        reader.join(timeout=2)
+        assert entered.is_set()
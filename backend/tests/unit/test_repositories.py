@@ -0,0 +1,319 @@
+"""
+Unit tests for data repositories
+"""
+import pytest
+from datetime import datetime, timedelta
+
+from data.models import (
+    Customer as CustomerModel,
+    CustomerEvent as CustomerEventModel,
+    HealthScore as HealthScoreModel,
+)
+from data.repositories import CustomerRepository, EventRepository, HealthScoreRepository
+from domain.models import Customer, FactorScore, HealthScore
+
+
+def _add_customer(db, email="repo@example.com", segment="enterprise"):
+    """Insert a customer row and return the refreshed model"""
+    customer = CustomerModel(
+        name="Repo Customer",
+        email=email,
+        company="Repo Co",
+        segment=segment
+    )
+    db.add(customer)
+    db.commit()
+    db.refresh(customer)
+    return customer
+
+
+def _add_health_score_row(db, customer_id, score=85.0, status="healthy"):
+    """Insert a health score row directly"""
+    db_score = HealthScoreModel(
+        customer_id=customer_id,
+        score=score,
+        status=status,
+        factors={},
+        recommendations=[],
+        calculated_at=datetime.utcnow()
+    )
+    db.add(db_score)
+    db.commit()
+    return db_score
+
+
+def _make_health_score(customer_id, score=85.0, status="healthy"):
+    """Build a health score domain entity with one factor"""
+    return HealthScore(
+        id=None,
+        customer_id=customer_id,
+        score=score,
+        status=status,
+        factors={
+            "api_usage": FactorScore(
+                score=score,
+                value=10,
+                description="API usage",
+                trend="stable",
+                metadata={"calls": 10}
+            )
+        },
+        recommendations=["Keep it up"],
+        calculated_at=datetime.utcnow()
+    )
+
+
+class TestCustomerRepository:
+
+    def test_get_by_id_found(self, db_session, clean_db):
+        """Test fetching an existing customer as a domain entity"""
+        db_customer = _add_customer(db_session)
+        repo = CustomerRepository(db_session)
+
+        customer = repo.get_by_id(db_customer.id)
+
+        assert isinstance(customer, Customer)
+        assert customer.id == db_customer.id
+        assert customer.email == "repo@example.com"
+
+    def test_get_by_id_not_found(self, db_session, clean_db):
+        """Test that a missing customer returns None"""
+        repo = CustomerRepository(db_session)
+        assert repo.get_by_id(9999) is None
+
+    def test_get_all(self, db_session, clean_db):
+        """Test fetching every customer"""
+        _add_customer(db_session, email="a@example.com")
+        _add_customer(db_session, email="b@example.com")
+        repo = CustomerRepository(db_session)
+
+        customers = repo.get_all()
+
+        assert len(customers) == 2
+        assert all(isinstance(c, Customer) for c in customers)
+
+    def test_get_by_health_status(self, db_session, clean_db):
+        """Test the status filter joins against health scores"""
+        healthy = _add_customer(db_session, email="healthy@example.com")
+        at_risk = _add_customer(db_session, email="risk@example.com")
+        _add_health_score_row(db_session, healthy.id, score=90.0, status="healthy")
+        _add_health_score_row(db_session, at_risk.id, score=55.0, status="at_risk")
+        repo = CustomerRepository(db_session)
+
+        result = repo.get_by_health_status("at_risk")
+
+        assert [c.id for c in result] == [at_risk.id]
+
+    def test_get_by_health_status_paginated(self, db_session, clean_db):
+        """Test that limit/offset are applied in id order"""
+        ids = []
+        for i in range(3):
+            customer = _add_customer(db_session, email=f"page{i}@example.com")
+            _add_health_score_row(db_session, customer.id, status="healthy")
+            ids.append(customer.id)
+        repo = CustomerRepository(db_session)
+
+        result = repo.get_by_health_status("healthy", limit=1, offset=1)
+
+        assert [c.id for c in result] == [ids[1]]
+
+    def test_update_last_activity(self, db_session, clean_db):
+        """Test that the last activity timestamp is written"""
+        db_customer = _add_customer(db_session)
+        repo = CustomerRepository(db_session)
+        timestamp = datetime(2026, 1, 1, 12, 0, 0)
+
+        repo.update_last_activity(db_customer.id, timestamp)
+
+        db_session.refresh(db_customer)
+        assert db_customer.last_activity == timestamp
+
+    def test_count(self, db_session, clean_db):
+        """Test the customer count"""
+        _add_customer(db_session, email="one@example.com")
+        _add_customer(db_session, email="two@example.com")
+        repo = CustomerRepository(db_session)
+
+        assert repo.count() == 2
+
+
+class TestEventRepository:
+
+    def test_create_event(self, db_session, clean_db):
+        """Test creating an event returns the persisted domain entity"""
+        customer = _add_customer(db_session)
+        repo = EventRepository(db_session)
+        timestamp = datetime.utcnow()
+
+        event = repo.create_event(customer.id, "login", {"ip_address": "10.0.0.1"}, timestamp)
+
+        assert event.id is not None
+        assert event.customer_id == customer.id
+        assert event.event_type == "login"
+        assert event.event_data == {"ip_address": "10.0.0.1"}
+
+    def test_create_event_and_touch_customer(self, db_session, clean_db):
+        """Test the fused insert also updates last_activity atomically"""
+        customer = _add_customer(db_session)
+        repo = EventRepository(db_session)
+        timestamp = datetime(2026, 2, 2, 8, 30, 0)
+
+        event = repo.create_event_and_touch_customer(
+            customer.id, "api_call", {"endpoint": "/api/data"}, timestamp
+        )
+
+        assert event.id is not None
+        assert event.timestamp == timestamp
+        db_session.refresh(customer)
+        assert customer.last_activity == timestamp
+
+    def test_get_recent_events_filters_by_window(self, db_session, clean_db):
+        """Test that events older than the window are excluded"""
+        customer = _add_customer(db_session)
+        repo = EventRepository(db_session)
+        repo.create_event(customer.id, "login", {}, datetime.utcnow() - timedelta(days=1))
+        repo.create_event(customer.id, "login", {}, datetime.utcnow() - timedelta(days=120))
+
+        events = repo.get_recent_events(customer.id, days=90)
+
+        assert len(events) == 1
+
+    def test_get_recent_events_bulk(self, db_session, clean_db):
+        """Test bulk loading groups events and keeps empty customers present"""
+        first = _add_customer(db_session, email="bulk1@example.com")
+        second = _add_customer(db_session, email="bulk2@example.com")
+        repo = EventRepository(db_session)
+        repo.create_event(first.id, "login", {}, datetime.utcnow() - timedelta(days=2))
+        repo.create_event(first.id, "api_call", {}, datetime.utcnow() - timedelta(days=1))
+
+        events_by_customer = repo.get_recent_events_bulk([first.id, second.id])
+
+        assert len(events_by_customer[first.id]) == 2
+        # Newest first, matching get_recent_events ordering
+        assert events_by_customer[first.id][0].event_type == "api_call"
+        assert events_by_customer[second.id] == []
+
+    def test_get_recent_events_bulk_empty_ids(self, db_session, clean_db):
+        """Test that no customer ids short-circuits without a query"""
+        repo = EventRepository(db_session)
+        assert repo.get_recent_events_bulk([]) == {}
+
+
+class TestHealthScoreRepository:
+
+    def test_save_health_score_creates_then_updates(self, db_session, clean_db):
+        """Test the upsert keeps a single row per customer"""
+        customer = _add_customer(db_session)
+        repo = HealthScoreRepository(db_session)
+
+        created = repo.save_health_score(_make_health_score(customer.id, score=80.0))
+        updated = repo.save_health_score(_make_health_score(customer.id, score=60.0, status="at_risk"))
+
+        assert updated.score == 60.0
+        assert updated.status == "at_risk"
+        rows = db_session.query(HealthScoreModel).filter(
+            HealthScoreModel.customer_id == customer.id
+        ).all()
+        assert len(rows) == 1
+        assert rows[0].id == created.id
+
+    def test_save_health_scores_bulk(self, db_session, clean_db):
+        """Test bulk save mixes updates of existing rows with new rows"""
+        first = _add_customer(db_session, email="bulkscore1@example.com")
+        second = _add_customer(db_session, email="bulkscore2@example.com")
+        repo = HealthScoreRepository(db_session)
+        repo.save_health_score(_make_health_score(first.id, score=80.0))
+
+        saved = repo.save_health_scores_bulk([
+            _make_health_score(first.id, score=40.0, status="critical"),
+            _make_health_score(second.id, score=90.0)
+        ])
+
+        assert len(saved) == 2
+        assert repo.get_latest_by_customer(first.id).score == 40.0
+        assert repo.get_latest_by_customer(second.id).score == 90.0
+
+    def test_save_health_scores_bulk_empty(self, db_session, clean_db):
+        """Test that an empty batch is a no-op"""
+        repo = HealthScoreRepository(db_session)
+        assert repo.save_health_scores_bulk([]) == []
+
+    def test_get_latest_by_customer_round_trips_factors(self, db_session, clean_db):
+        """Test factor scores and metadata survive the JSON round trip"""
+        customer = _add_customer(db_session)
+        repo = HealthScoreRepository(db_session)
+        repo.save_health_score(_make_health_score(customer.id))
+
+        loaded = repo.get_latest_by_customer(customer.id)
+
+        factor = loaded.factors["api_usage"]
+        assert factor.score == 85.0
+        assert factor.value == 10
+        assert factor.description == "API usage"
+        assert factor.trend == "stable"
+        assert factor.metadata == {"calls": 10}
+        assert loaded.recommendations == ["Keep it up"]
+
+    def test_get_latest_by_customer_not_found(self, db_session, clean_db):
+        """Test that a customer without a score returns None"""
+        repo = HealthScoreRepository(db_session)
+        assert repo.get_latest_by_customer(9999) is None
+
+    def test_get_latest_by_customers(self, db_session, clean_db):
+        """Test bulk score lookup keys by customer id"""
+        first = _add_customer(db_session, email="latest1@example.com")
+        second = _add_customer(db_session, email="latest2@example.com")
+        repo = HealthScoreRepository(db_session)
+        repo.save_health_score(_make_health_score(first.id, score=70.0))
+
+        scores = repo.get_latest_by_customers([first.id, second.id])
+
+        assert scores[first.id].score == 70.0
+        assert second.id not in scores
+        assert repo.get_latest_by_customers([]) == {}
+
+    def test_get_historical_scores(self, db_session, clean_db):
+        """Test historical scores return the single stored score"""
+        customer = _add_customer(db_session)
+        repo = HealthScoreRepository(db_session)
+        assert repo.get_historical_scores(customer.id) == []
+
+        repo.save_health_score(_make_health_score(customer.id))
+        assert len(repo.get_historical_scores(customer.id)) == 1
+
+    def test_count_by_status(self, db_session, clean_db):
+        """Test counting scores by status"""
+        first = _add_customer(db_session, email="count1@example.com")
+        second = _add_customer(db_session, email="count2@example.com")
+        repo = HealthScoreRepository(db_session)
+        repo.save_health_score(_make_health_score(first.id, status="healthy"))
+        repo.save_health_score(_make_health_score(second.id, score=30.0, status="critical"))
+
+        assert repo.count_by_status("healthy") == 1
+        assert repo.count_by_status("critical") == 1
+        assert repo.count_by_status("at_risk") == 0
+
+    def test_get_dashboard_stats(self, db_session, clean_db):
+        """Test the single-statement dashboard aggregates"""
+        first = _add_customer(db_session, email="stats1@example.com")
+        second = _add_customer(db_session, email="stats2@example.com")
+        repo = HealthScoreRepository(db_session)
+        repo.save_health_score(_make_health_score(first.id, score=90.0, status="healthy"))
+        repo.save_health_score(_make_health_score(second.id, score=50.0, status="at_risk"))
+
+        stats = repo.get_dashboard_stats()
+
+        assert stats["total_customers"] == 2
+        assert stats["healthy_customers"] == 1
+        assert stats["at_risk_customers"] == 1
+        assert stats["critical_customers"] == 0
+        assert stats["average_score"] == 70.0
+
+    def test_get_average_score(self, db_session, clean_db):
+        """Test the SQL average, including the empty table case"""
+        repo = HealthScoreRepository(db_session)
+        assert repo.get_average_score() == 0.0
+
+        customer = _add_customer(db_session)
+        repo.save_health_score(_make_health_score(customer.id, score=75.0))
+        assert repo.get_average_score() == 75.0
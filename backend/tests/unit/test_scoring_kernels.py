@@ -0,0 +1,79 @@
+"""
+Unit tests for shared scoring kernels
+"""
+import pytest
+
+from domain.health_factors._kernels import (
+    make_ratio_scorer,
+    ratio_score,
+    ratio_scores,
+    classify_trend,
+)
+
+
+class TestRatioScore:
+
+    def test_below_expected(self):
+        """Test partial score when count is below expected"""
+        assert ratio_score(10, 20) == 50.0
+
+    def test_at_expected(self):
+        """Test full score when count meets expected"""
+        assert ratio_score(20, 20) == 100.0
+
+    def test_above_expected_capped(self):
+        """Test score is capped at 100 when count exceeds expected"""
+        assert ratio_score(50, 20) == 100.0
+
+    def test_zero_count(self):
+        """Test zero count yields zero score"""
+        assert ratio_score(0, 20) == 0.0
+
+    def test_zero_expected(self):
+        """Test zero expected yields zero score instead of dividing by zero"""
+        assert ratio_score(10, 0) == 0.0
+
+
+class TestRatioScores:
+
+    def test_batch_matches_scalar(self):
+        """Test batch scoring matches per-item scalar scoring"""
+        counts = [0, 5, 10, 20, 100]
+        assert ratio_scores(counts, 20) == [ratio_score(c, 20) for c in counts]
+
+    def test_empty_batch(self):
+        """Test empty input produces empty output"""
+        assert ratio_scores([], 20) == []
+
+    def test_zero_expected(self):
+        """Test zero expected yields all-zero scores"""
+        assert ratio_scores([1, 2, 3], 0) == [0.0, 0.0, 0.0]
+
+
+class TestMakeRatioScorer:
+
+    def test_specialized_matches_generic(self):
+        """Test specialized scorer matches the generic ratio_score"""
+        scorer = make_ratio_scorer(20)
+        for count in [0, 5, 10, 20, 100]:
+            assert scorer(count) == ratio_score(count, 20)
+
+    def test_zero_expected(self):
+        """Test specialized scorer for zero expected always returns zero"""
+        scorer = make_ratio_scorer(0)
+        assert scorer(10) == 0.0
+
+
+class TestClassifyTrend:
+
+    def test_improving(self):
+        """Test trend is improving when recent activity is higher"""
+        assert classify_trend(10, 5) == "improving"
+
+    def test_declining(self):
+        """Test trend is declining when recent activity is lower"""
+        assert classify_trend(5, 10) == "declining"
+
+    def test_stable(self):
+        """Test trend is stable when activity is unchanged"""
+        assert classify_trend(7, 7) == "stable"